@@ -13,6 +13,11 @@ class FailureAnalyzer:
     def __init__(self, ai_engine: Optional[AIEngine] = None) -> None:
         self.ai_engine = ai_engine or NullAIEngine()
 
+    @property
+    def enabled(self) -> bool:
+        """Return True when a real AI engine is configured."""
+        return not isinstance(self.ai_engine, NullAIEngine)
+
     def analyze(self, error_message: str, step: str) -> FailureInsight:
         """Classify a failure and suggest remediation."""
         return self.ai_engine.classify_failure(error_message, step)
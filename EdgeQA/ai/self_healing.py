@@ -13,6 +13,11 @@ class SelfHealingLocator:
     def __init__(self, ai_engine: Optional[AIEngine] = None) -> None:
         self.ai_engine = ai_engine or NullAIEngine()
 
+    @property
+    def enabled(self) -> bool:
+        """Return True when a real AI engine can consume page snapshots."""
+        return not isinstance(self.ai_engine, NullAIEngine)
+
     def heal(self, locator: str, page_snapshot: str) -> Optional[str]:
         """Try to heal a locator based on a page snapshot."""
         return self.ai_engine.heal_locator(locator, page_snapshot)
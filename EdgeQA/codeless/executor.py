@@ -3,35 +3,96 @@
 from __future__ import annotations
 
 import json
+import logging
 import os
+import queue
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 import asyncio
 import contextlib
+import functools
+import itertools
 import threading
+import time
 
 try:
     import allure
 except Exception:  # noqa: BLE001
     allure = None
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from ai.failure_analyzer import FailureAnalyzer
 from ai.self_healing import SelfHealingLocator
 from codeless.keyword_library import KeywordLibrary
-from codeless.step_mapper import build_action_map
 from codeless.validations import validate_actions, validate_step_fields
 from core.api_client import ApiClient
 from core.driver_factory import create_playwright_manager
-from data.excel_reader import load_flows_from_excel, load_steps_from_excel, load_testcases_from_excel
+from data.excel_reader import load_all_from_excel
 from data.json_reader import load_steps_from_json
 from data.object_repository_loader import load_object_repository
+from utils.concurrency_utils import drain_queue, is_event_loop_running
 from utils.config_loader import load_config
 from utils.file_utils import ensure_dirs, resolve_path
 from utils.logger import get_logger
 
+_PLACEHOLDER_RE = re.compile(r"\{\{([A-Za-z_][A-Za-z0-9_]*)\}\}")
+_URL_SCHEME_RE = re.compile(r"^https?://")
+_LOCATOR_PREFIX_RE = re.compile(r"^(?:css|xpath|text|id)=")
+_SELECTOR_PREFIXES = {
+    "css": "css=",
+    "xpath": "xpath=",
+    "text": "text=",
+    "id": "id=",
+}
+# Only moves a suite off the event loop thread; the suite runs its own worker pool.
+_SUITE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="edgeqa-suite")
+
+_NO_ARG_ACTIONS = frozenset(
+    {
+        "browser_back",
+        "browser_refresh",
+        "launch_incognito_mode",
+        "switch_to_main_frame",
+        "maximize_window",
+    }
+)
+_LOCATOR_ACTIONS = frozenset(
+    {
+        "click",
+        "double_click",
+        "right_click",
+        "hover",
+        "scroll_to",
+        "wait_for_element",
+        "wait_for_visible",
+        "wait_for_hidden",
+        "wait_for_attached",
+        "wait_for_detached",
+        "wait_for_enabled",
+        "wait_for_disabled",
+        "assert_visible",
+        "clear_text",
+        "switch_to_frame",
+    }
+)
+_LOCATOR_VALUE_ACTIONS = frozenset({"fill_text", "select_dropdown", "press_key"})
+_LOCATOR_EXPECTED_ACTIONS = frozenset({"assert_text", "assert_contains_text", "wait_for_text"})
+_EXPECTED_ACTIONS = frozenset({"assert_title", "wait_for_url", "wait_for_load_state"})
+_API_GET_ACTIONS = frozenset({"api_get", "api_head"})
+_API_BODY_ACTIONS = frozenset({"api_post", "api_put", "api_delete", "api_patch"})
+
 
-@dataclass
+@dataclass(slots=True)
 class CodelessStep:
     """Normalized codeless step."""
 
@@ -73,24 +134,32 @@ class CodelessExecutor:
         self.logger = get_logger("edgeqa_codeless", logs_dir=resolve_path(root_dir, "logs"))
         self.failure_analyzer = FailureAnalyzer() if self.config["config"]["ai"]["enabled"] else None
         self.self_healer = SelfHealingLocator() if self.config["config"]["ai"]["enabled"] else None
-        self._flow_stack: List[str] = []
+        self._local = threading.local()
         self._flow_resolver: Optional[FlowResolver] = None
         self._suite_dir: Optional[str] = None
-        self._object_repo: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        self._flat_repo: Dict[str, str] = {}
+        self._object_repo = {}
         self._object_repo_path = resolve_path(self.root_dir, "InputSheet", "ObjectRepository.xlsx")
-        self._action_map = None
-        self._manager = None
+        self._variable_context: Optional[Dict[str, str]] = None
+        verbose_pom = bool(self.config["config"].get("logging", {}).get("verbose_pom", False))
+        self._pom_log_level = logging.INFO if verbose_pom else logging.DEBUG
 
     def execute_suite(self, suite_path: str, sheet_name: Optional[str] = None) -> None:
         """Execute a codeless suite."""
-        if _is_event_loop_running():
-            _run_in_thread(self._execute_suite_internal, suite_path, sheet_name)
+        if is_event_loop_running():
+            _SUITE_EXECUTOR.submit(self._execute_suite_internal, suite_path, sheet_name).result()
             return
         self._execute_suite_internal(suite_path, sheet_name)
 
+    async def execute_suite_async(self, suite_path: str, sheet_name: Optional[str] = None) -> None:
+        """Execute a codeless suite without blocking the running event loop."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(_SUITE_EXECUTOR, self._execute_suite_internal, suite_path, sheet_name)
+
     def _execute_suite_internal(self, suite_path: str, sheet_name: Optional[str]) -> None:
         """Execute a codeless suite in the current thread."""
         self._suite_dir = os.path.dirname(suite_path)
+        self.refresh_variables()
         self._object_repo = load_object_repository(self._object_repo_path)
         steps_by_test, flows, test_case_ids = self._load_steps(suite_path, sheet_name)
         self._flow_resolver = FlowResolver(flows, test_case_ids)
@@ -98,11 +167,32 @@ class CodelessExecutor:
             validate_actions(step.action for step in steps)
         for flow_steps in flows.values():
             validate_actions(step.action for step in flow_steps)
+        for step in itertools.chain.from_iterable(itertools.chain(steps_by_test.values(), flows.values())):
+            validate_step_fields(step.action, step.locator, step.value, step.expected)
 
         reports_dir = resolve_path(self.root_dir, "reports")
         artifacts_dir = resolve_path(reports_dir, "artifacts")
         ensure_dirs([reports_dir, artifacts_dir])
 
+        workers = int(self.config["config"].get("parallel", {}).get("workers", 1) or 1)
+        if workers > 1 and len(steps_by_test) > 1:
+            self._run_tests_parallel(steps_by_test, artifacts_dir, workers)
+            return
+        self._run_tests(steps_by_test.items(), artifacts_dir)
+
+    def _run_tests_parallel(self, steps_by_test: Dict[str, List[CodelessStep]], artifacts_dir: str, workers: int) -> None:
+        """Run tests across a pool of workers pulling from a shared queue."""
+        pending: "queue.SimpleQueue[Tuple[str, List[CodelessStep]]]" = queue.SimpleQueue()
+        for item in steps_by_test.items():
+            pending.put(item)
+        pool_size = min(workers, len(steps_by_test))
+        with ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="edgeqa-codeless") as pool:
+            futures = [pool.submit(self._run_tests, drain_queue(pending), artifacts_dir) for _ in range(pool_size)]
+        for future in futures:
+            future.result()
+
+    def _run_tests(self, tests: Iterable[Tuple[str, List[CodelessStep]]], artifacts_dir: str) -> None:
+        """Run tests sequentially on a browser session owned by the current thread."""
         browser_name = self.config["browser_name"]
         browser_config = self.config["browser"]
         env = self.config["environment"]
@@ -122,16 +212,15 @@ class CodelessExecutor:
             page=page,
             api_client=api_client,
             timeout_ms=self.config["config"]["timeouts"]["default"],
-            flow_handler=self._execute_flow,
             logger=self.logger,
             artifacts_dir=artifacts_dir,
             manager=manager,
         )
-        action_map = build_action_map(keywords.ui, keywords.api, call_flow=keywords.call_flow)
-        self._set_execution_context(action_map, manager)
+        action_map = keywords.action_map
+        keywords.flow_handler = functools.partial(self._execute_flow, action_map=action_map, manager=manager)
 
         try:
-            for test_name, steps in steps_by_test.items():
+            for test_name, steps in tests:
                 self.logger.info("Starting codeless test: %s", test_name)
                 for step in steps:
                     self._execute_step(step, action_map, manager)
@@ -141,11 +230,12 @@ class CodelessExecutor:
 
     def _execute_step(self, step: CodelessStep, action_map, manager, flow_name: Optional[str] = None) -> None:
         """Execute a single codeless step with retry and logging."""
-        retries = int(self.config["config"]["retries"]["step"])
+        retry_config = self.config["config"]["retries"]
+        retries = int(retry_config["step"])
+        delay = float(retry_config.get("initial_delay_ms", 100)) / 1000.0
         attempt = 0
         while True:
             try:
-                validate_step_fields(step.action, step.locator, step.value, step.expected)
                 if flow_name:
                     self.logger.info("[FLOW STEP] %s -> %s", step.action, step.locator or step.value or "")
                 else:
@@ -156,7 +246,7 @@ class CodelessExecutor:
                 return
             except Exception as exc:  # noqa: BLE001
                 attempt += 1
-                if self.self_healer and step.locator:
+                if self.self_healer and self.self_healer.enabled and step.locator:
                     try:
                         page_snapshot = manager.page.content() if manager.page else ""
                         healed = self.self_healer.heal(step.locator, page_snapshot)
@@ -165,116 +255,25 @@ class CodelessExecutor:
                             step.locator = healed
                     except Exception:  # noqa: BLE001
                         pass
+                if attempt <= retries:
+                    self.logger.warning("Retrying step %s in %.0fms | error=%s", step.step, delay * 1000, str(exc))
+                    time.sleep(delay)
+                    delay *= 2
+                    continue
                 screenshot = manager.screenshot_on_failure(step.step)
                 self.logger.error("Step failed: %s | error=%s | screenshot=%s", step.step, str(exc), screenshot)
-                if self.failure_analyzer:
+                if self.failure_analyzer and self.failure_analyzer.enabled:
                     insight = self.failure_analyzer.analyze(str(exc), step.step)
                     self.logger.error("Failure insight: %s", insight)
-                if attempt > retries:
-                    raise
+                raise
 
     def _dispatch(self, step: CodelessStep, action_map) -> None:
         """Dispatch a step to its corresponding action."""
-        action = action_map[step.action]
-        if step.action == "open_url":
-            base_url = self.config["environment"].get("base_url", "")
-            url = step.value or step.locator or ""
-            action(_combine_url(base_url, self._resolve_placeholders(url)))
-            return
-        if step.action == "CALL_FLOW":
-            flow_name = self._resolve_placeholders(step.locator or step.value or "")
-            action(flow_name)
-            return
-        if step.action in {
-            "click",
-            "double_click",
-            "right_click",
-            "hover",
-            "scroll_to",
-            "wait_for_element",
-            "wait_for_visible",
-            "wait_for_hidden",
-            "wait_for_attached",
-            "wait_for_detached",
-            "wait_for_enabled",
-            "wait_for_disabled",
-            "assert_visible",
-            "clear_text",
-            "browser_back",
-            "browser_refresh",
-            "launch_incognito_mode",
-            "switch_to_main_frame",
-            "maximize_window",
-        }:
-            if step.action in {
-                "browser_back",
-                "browser_refresh",
-                "launch_incognito_mode",
-                "switch_to_main_frame",
-                "maximize_window",
-            }:
-                action()
-            else:
-                action(self._resolve_locator(self._resolve_placeholders(step.locator or "")))
-            return
-        if step.action in {"fill_text", "select_dropdown", "press_key"}:
-            action(
-                self._resolve_locator(self._resolve_placeholders(step.locator or "")),
-                self._resolve_placeholders(step.value or ""),
-            )
-            return
-        if step.action == "screenshot_full_page":
-            action(self._resolve_placeholders(step.value or step.expected))
-            return
-        if step.action == "screenshot_element":
-            action(
-                self._resolve_locator(self._resolve_placeholders(step.locator or "")),
-                self._resolve_placeholders(step.value or step.expected),
-            )
-            return
-        if step.action == "new_tab":
-            action(self._resolve_placeholders(step.value or step.locator))
-            return
-        if step.action == "switch_window":
-            action(_to_int(self._resolve_placeholders(step.value or step.locator) or "0") or 0)
-            return
-        if step.action == "close_tab":
-            index = _to_int(self._resolve_placeholders(step.value or step.locator))
-            action(index)
-            return
-        if step.action == "switch_to_frame":
-            action(self._resolve_locator(self._resolve_placeholders(step.locator or "")))
-            return
-        if step.action in {"assert_text", "assert_contains_text"}:
-            action(
-                self._resolve_locator(self._resolve_placeholders(step.locator or "")),
-                self._resolve_placeholders(step.expected or step.value or ""),
-            )
-            return
-        if step.action == "wait_for_text":
-            action(
-                self._resolve_locator(self._resolve_placeholders(step.locator or "")),
-                self._resolve_placeholders(step.expected or step.value or ""),
-            )
-            return
-        if step.action == "assert_title":
-            action(self._resolve_placeholders(step.expected or step.value or ""))
-            return
-        if step.action == "wait_for_url":
-            action(self._resolve_placeholders(step.expected or step.value or ""))
-            return
-        if step.action == "wait_for_load_state":
-            action(self._resolve_placeholders(step.expected or step.value or ""))
-            return
-        if step.action in {"api_get", "api_head"}:
-            endpoint = step.value or step.locator or ""
-            action(self._resolve_placeholders(endpoint), expected_status=_to_int(self._resolve_placeholders(step.expected)))
-            return
-        if step.action in {"api_post", "api_put", "api_delete", "api_patch"}:
-            payload = self._load_payload(step.value)
-            action(self._resolve_placeholders(step.locator or ""), payload, expected_status=_to_int(self._resolve_placeholders(step.expected)))
-            return
-        raise ValueError(f"Unsupported action: {step.action}")
+        try:
+            handler = _DISPATCHERS[step.action]
+        except KeyError:
+            raise ValueError(f"Unsupported action: {step.action}") from None
+        handler(self, step, action_map[step.action])
 
     def _load_steps(
         self,
@@ -283,28 +282,16 @@ class CodelessExecutor:
     ) -> tuple[Dict[str, List[CodelessStep]], Dict[str, List[CodelessStep]], List[str]]:
         """Load suite steps and flows from Excel or JSON."""
         if suite_path.endswith(".xlsx"):
-            flows = _normalize_records(load_flows_from_excel(suite_path))
-            testcases = load_testcases_from_excel(suite_path)
-            test_case_ids = [case.test_case_id for case in testcases]
-            if sheet_name:
-                records = load_steps_from_excel(suite_path, sheet_name=sheet_name)
-                return {"sheet": _records_to_steps(records)}, flows, test_case_ids
-            if testcases:
-                steps_by_test = {}
-                for case in testcases:
-                    if case.execute:
-                        records = load_steps_from_excel(suite_path, sheet_name=case.test_case_id)
-                        steps_by_test[case.test_case_id] = _records_to_steps(records)
-                return steps_by_test, flows, test_case_ids
-            records = load_steps_from_excel(suite_path, sheet_name=None)
-            return {"sheet": _records_to_steps(records)}, flows, test_case_ids
+            records_by_test, flow_records, test_case_ids = _load_excel_suite(suite_path, sheet_name)
+            steps_by_test = {name: _records_to_steps(records) for name, records in records_by_test.items()}
+            return steps_by_test, _normalize_records(flow_records), test_case_ids
         elif suite_path.endswith(".json"):
             records = load_steps_from_json(suite_path)
             return {"sheet": _records_to_steps(records)}, {}, []
         else:
             raise ValueError("Unsupported suite file. Use .xlsx or .json")
 
-    def _execute_flow(self, flow_name: str) -> None:
+    def _execute_flow(self, flow_name: str, action_map, manager) -> None:
         """Execute a reusable flow with safety checks."""
         if not self._flow_resolver:
             raise ValueError("Flow resolver not initialized.")
@@ -315,19 +302,22 @@ class CodelessExecutor:
         try:
             with _allure_step(f"[FLOW START] {flow_name}"):
                 for step in flow_steps:
-                    self._execute_step(step, self._action_map, self._manager, flow_name=flow_name)
+                    self._execute_step(step, action_map, manager, flow_name=flow_name)
         finally:
             self._flow_stack.pop()
 
     def _resolve_placeholders(self, text: Optional[str]) -> Optional[str]:
         """Resolve placeholders using configured context."""
-        if text is None:
-            return None
-        resolved = text
-        variables = self._build_variable_context()
-        for key, value in variables.items():
-            resolved = resolved.replace(f"{{{{{key}}}}}", value)
-        return resolved
+        if text is None or "{{" not in text:
+            return text
+        variables = self._variable_context
+        if variables is None:
+            variables = self._variable_context = self._build_variable_context()
+        return _PLACEHOLDER_RE.sub(lambda match: variables.get(match.group(1), match.group(0)), text)
+
+    def refresh_variables(self) -> None:
+        """Rebuild placeholder variables after config or environment changes."""
+        self._variable_context = self._build_variable_context()
 
     def _build_variable_context(self) -> Dict[str, str]:
         """Build a dictionary of placeholder variables."""
@@ -348,14 +338,24 @@ class CodelessExecutor:
         if resolved.endswith(".json") and self._suite_dir:
             payload_path = os.path.join(self._suite_dir, resolved)
             if os.path.exists(payload_path):
-                with open(payload_path, "r", encoding="utf-8") as handle:
-                    return json.load(handle)
-        return json.loads(resolved)
+                return _json_loads(_read_payload_file(payload_path, os.path.getmtime(payload_path)))
+        return _json_loads(resolved)
+
+    @property
+    def _flow_stack(self) -> List[str]:
+        stack = getattr(self._local, "flow_stack", None)
+        if stack is None:
+            stack = self._local.flow_stack = []
+        return stack
+
+    @property
+    def _object_repo(self) -> Dict[str, Dict[str, Tuple[str, str]]]:
+        return self._object_repo_data
 
-    def _set_execution_context(self, action_map, manager) -> None:
-        """Store execution context for nested flow calls."""
-        self._action_map = action_map
-        self._manager = manager
+    @_object_repo.setter
+    def _object_repo(self, repository: Dict[str, Dict[str, Tuple[str, str]]]) -> None:
+        self._object_repo_data = repository
+        self._flat_repo = _flatten_object_repo(repository)
 
     def _resolve_locator(self, locator: Optional[str]) -> str:
         """Resolve POM-style locators to Playwright selectors."""
@@ -363,6 +363,16 @@ class CodelessExecutor:
             return ""
         if "." not in locator:
             return locator
+        selector = self._flat_repo.get(locator)
+        if selector is None:
+            selector = self._resolve_locator_slow(locator)
+        if self.logger.isEnabledFor(self._pom_log_level):
+            self.logger.log(self._pom_log_level, "[POM] Resolved %s -> %s", locator, selector)
+            _allure_attach_text(f"{locator} -> {selector}", "POM Resolver")
+        return selector
+
+    def _resolve_locator_slow(self, locator: str) -> str:
+        """Validate a POM locator that missed the flattened map and raise a precise error."""
         if locator.count(".") != 1:
             raise ValueError("Invalid locator format. Expected PageName.LocatorName")
         page_name, locator_name = locator.split(".", 1)
@@ -374,20 +384,27 @@ class CodelessExecutor:
         if locator_name not in page_locators:
             raise ValueError(f"Locator '{locator_name}' not found in page '{page_name}'")
         locator_type, locator_value = page_locators[locator_name]
-        selector = _to_selector(locator_type, locator_value)
-        self.logger.info("[POM] Resolved %s -> %s", locator, selector)
-        _allure_attach_text(f"{locator} -> {selector}", "POM Resolver")
-        return selector
+        return _to_selector(locator_type, locator_value)
+
+
+def _flatten_object_repo(repository: Dict[str, Dict[str, Tuple[str, str]]]) -> Dict[str, str]:
+    """Precompute "Page.Locator" -> selector for every valid repository entry."""
+    flat: Dict[str, str] = {}
+    for page_name, page_locators in repository.items():
+        for locator_name, (locator_type, locator_value) in page_locators.items():
+            if "." in page_name or "." in locator_name:
+                continue
+            try:
+                flat[f"{page_name}.{locator_name}"] = _to_selector(locator_type, locator_value)
+            except ValueError:
+                continue
+    return flat
 
 
 def _combine_url(base_url: str, path: str) -> str:
-    if path.startswith("http://") or path.startswith("https://"):
+    if _URL_SCHEME_RE.match(path):
         return path
-    if base_url.endswith("/") and path.startswith("/"):
-        return base_url[:-1] + path
-    if not base_url.endswith("/") and not path.startswith("/"):
-        return f"{base_url}/{path}"
-    return base_url + path
+    return f"{base_url.rstrip('/')}/{path.lstrip('/')}"
 
 
 def _to_int(value: Optional[str]) -> Optional[int]:
@@ -399,9 +416,51 @@ def _to_int(value: Optional[str]) -> Optional[int]:
         return None
 
 
+def _load_excel_suite(
+    suite_path: str,
+    sheet_name: Optional[str],
+) -> Tuple[Dict[str, List[object]], Dict[str, List[object]], List[str]]:
+    """Parse an Excel suite once per file version and reuse the records on later runs."""
+    abs_path = os.path.abspath(suite_path)
+    stat = os.stat(abs_path)
+    return _parse_excel_suite(abs_path, stat.st_mtime_ns, stat.st_size, sheet_name)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_excel_suite(
+    abs_path: str,
+    mtime_ns: int,
+    size: int,
+    sheet_name: Optional[str],
+) -> Tuple[Dict[str, List[object]], Dict[str, List[object]], List[str]]:
+    steps_by_sheet, flows, testcases = load_all_from_excel(abs_path, sheet_name)
+    test_case_ids = [case.test_case_id for case in testcases]
+    if sheet_name or not testcases:
+        records_by_test = {"sheet": next(iter(steps_by_sheet.values()))}
+    else:
+        records_by_test = steps_by_sheet
+    return records_by_test, flows, test_case_ids
+
+
+@functools.lru_cache(maxsize=128)
+def _read_payload_file(path: str, mtime: float) -> str:
+    """Return payload file text; mtime is part of the cache key so edits are picked up."""
+    with open(path, "r", encoding="utf-8") as handle:
+        return handle.read()
+
+
 def _records_to_steps(records: List[object]) -> List[CodelessStep]:
     """Convert Excel/JSON step records to CodelessStep objects."""
-    return [CodelessStep(**record.__dict__) for record in records]
+    return [
+        CodelessStep(
+            step=record.step,
+            action=sys.intern(record.action),
+            locator=record.locator,
+            value=record.value,
+            expected=record.expected,
+        )
+        for record in records
+    ]
 
 
 def _normalize_records(flow_records: Dict[str, List[object]]) -> Dict[str, List[CodelessStep]]:
@@ -435,44 +494,117 @@ def _allure_attach_text(content: str, name: str) -> None:
             return
 
 
-def _is_event_loop_running() -> bool:
-    """Return True if an asyncio loop is running in this thread."""
-    try:
-        loop = asyncio.get_running_loop()
-        return loop.is_running()
-    except RuntimeError:
-        return False
-
-
-def _run_in_thread(func, *args, **kwargs) -> None:
-    """Run a callable in a dedicated thread and re-raise errors."""
-    exception_holder = []
-
-    def _target():
-        try:
-            func(*args, **kwargs)
-        except Exception as exc:  # noqa: BLE001
-            exception_holder.append(exc)
-
-    thread = threading.Thread(target=_target, daemon=True)
-    thread.start()
-    thread.join()
-    if exception_holder:
-        raise exception_holder[0]
-
-
+@functools.lru_cache(maxsize=512)
 def _to_selector(locator_type: str, locator_value: str) -> str:
     locator_type = locator_type.strip().lower()
     locator_value = locator_value.strip()
-    if locator_value.startswith(("css=", "xpath=", "text=", "id=")):
+    if _LOCATOR_PREFIX_RE.match(locator_value):
         return locator_value
-    mapping = {
-        "css": "css=",
-        "xpath": "xpath=",
-        "text": "text=",
-        "id": "id=",
-    }
-    prefix = mapping.get(locator_type)
+    prefix = _SELECTOR_PREFIXES.get(locator_type)
     if not prefix:
         raise ValueError(f"Unsupported locator type: {locator_type}")
     return f"{prefix}{locator_value}"
+
+
+def _run_no_arg(executor: CodelessExecutor, step: CodelessStep, action: Callable) -> None:
+    action()
+
+
+def _run_locator(executor: CodelessExecutor, step: CodelessStep, action: Callable) -> None:
+    action(executor._resolve_locator(executor._resolve_placeholders(step.locator or "")))
+
+
+def _run_locator_value(executor: CodelessExecutor, step: CodelessStep, action: Callable) -> None:
+    action(
+        executor._resolve_locator(executor._resolve_placeholders(step.locator or "")),
+        executor._resolve_placeholders(step.value or ""),
+    )
+
+
+def _run_locator_expected(executor: CodelessExecutor, step: CodelessStep, action: Callable) -> None:
+    action(
+        executor._resolve_locator(executor._resolve_placeholders(step.locator or "")),
+        executor._resolve_placeholders(step.expected or step.value or ""),
+    )
+
+
+def _run_expected(executor: CodelessExecutor, step: CodelessStep, action: Callable) -> None:
+    action(executor._resolve_placeholders(step.expected or step.value or ""))
+
+
+def _run_api_get(executor: CodelessExecutor, step: CodelessStep, action: Callable) -> None:
+    endpoint = step.value or step.locator or ""
+    action(
+        executor._resolve_placeholders(endpoint),
+        expected_status=_to_int(executor._resolve_placeholders(step.expected)),
+    )
+
+
+def _run_api_body(executor: CodelessExecutor, step: CodelessStep, action: Callable) -> None:
+    payload = executor._load_payload(step.value)
+    action(
+        executor._resolve_placeholders(step.locator or ""),
+        payload,
+        expected_status=_to_int(executor._resolve_placeholders(step.expected)),
+    )
+
+
+def _run_open_url(executor: CodelessExecutor, step: CodelessStep, action: Callable) -> None:
+    base_url = executor.config["environment"].get("base_url", "")
+    url = step.value or step.locator or ""
+    action(_combine_url(base_url, executor._resolve_placeholders(url)))
+
+
+def _run_call_flow(executor: CodelessExecutor, step: CodelessStep, action: Callable) -> None:
+    action(executor._resolve_placeholders(step.locator or step.value or ""))
+
+
+def _run_screenshot_full_page(executor: CodelessExecutor, step: CodelessStep, action: Callable) -> None:
+    action(executor._resolve_placeholders(step.value or step.expected))
+
+
+def _run_screenshot_element(executor: CodelessExecutor, step: CodelessStep, action: Callable) -> None:
+    action(
+        executor._resolve_locator(executor._resolve_placeholders(step.locator or "")),
+        executor._resolve_placeholders(step.value or step.expected),
+    )
+
+
+def _run_new_tab(executor: CodelessExecutor, step: CodelessStep, action: Callable) -> None:
+    action(executor._resolve_placeholders(step.value or step.locator))
+
+
+def _run_switch_window(executor: CodelessExecutor, step: CodelessStep, action: Callable) -> None:
+    action(_to_int(executor._resolve_placeholders(step.value or step.locator) or "0") or 0)
+
+
+def _run_close_tab(executor: CodelessExecutor, step: CodelessStep, action: Callable) -> None:
+    action(_to_int(executor._resolve_placeholders(step.value or step.locator)))
+
+
+def _build_dispatchers() -> Dict[str, Callable[[CodelessExecutor, CodelessStep, Callable], None]]:
+    """Build the action -> handler table once at import time."""
+    dispatchers: Dict[str, Callable[[CodelessExecutor, CodelessStep, Callable], None]] = {
+        "open_url": _run_open_url,
+        "CALL_FLOW": _run_call_flow,
+        "screenshot_full_page": _run_screenshot_full_page,
+        "screenshot_element": _run_screenshot_element,
+        "new_tab": _run_new_tab,
+        "switch_window": _run_switch_window,
+        "close_tab": _run_close_tab,
+    }
+    for actions, handler in (
+        (_NO_ARG_ACTIONS, _run_no_arg),
+        (_LOCATOR_ACTIONS, _run_locator),
+        (_LOCATOR_VALUE_ACTIONS, _run_locator_value),
+        (_LOCATOR_EXPECTED_ACTIONS, _run_locator_expected),
+        (_EXPECTED_ACTIONS, _run_expected),
+        (_API_GET_ACTIONS, _run_api_get),
+        (_API_BODY_ACTIONS, _run_api_body),
+    ):
+        for name in actions:
+            dispatchers[name] = handler
+    return dispatchers
+
+
+_DISPATCHERS = _build_dispatchers()
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Optional
+from functools import cached_property
+from typing import Callable, Dict, Optional
 
 import logging
 
+from codeless.step_mapper import build_action_map
 from core.api_client import ApiClient
 from keywords.api_keywords import APIKeywords
 from keywords.ui_keywords import UIKeywords
@@ -39,14 +41,19 @@ class KeywordLibrary:
             logger=logger,
         )
 
+    @cached_property
+    def action_map(self) -> Dict[str, Callable]:
+        """Return the action -> callable mapping for this library, built once."""
+        return build_action_map(self.ui, self.api, call_flow=self.call_flow)
+
     def call_flow(self, flow_name: str) -> None:
         """Invoke a reusable flow via the assigned handler."""
         if not self.flow_handler:
             raise ValueError("CALL_FLOW is not configured for this execution.")
         if self.logger:
-            self.logger.info("[FLOW START] %s", flow_name)
+            self.logger.debug("[FLOW START] %s", flow_name)
         try:
             self.flow_handler(flow_name)
         finally:
             if self.logger:
-                self.logger.info("[FLOW END] %s", flow_name)
+                self.logger.debug("[FLOW END] %s", flow_name)
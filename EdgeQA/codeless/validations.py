@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Iterable, Tuple
 
 
-REQUIRED_ACTIONS = {
+UI_ACTIONS: Tuple[str, ...] = (
     "open_url",
     "click",
     "double_click",
@@ -41,58 +41,71 @@ REQUIRED_ACTIONS = {
     "switch_to_frame",
     "switch_to_main_frame",
     "maximize_window",
+)
+
+API_ACTIONS: Tuple[str, ...] = (
     "api_get",
     "api_post",
     "api_put",
     "api_delete",
     "api_patch",
     "api_head",
-    "CALL_FLOW",
-}
+)
+
+REQUIRED_ACTIONS = frozenset(UI_ACTIONS + API_ACTIONS + ("CALL_FLOW",))
+
+
+_LOCATOR_REQUIRED = frozenset({
+    "click",
+    "double_click",
+    "right_click",
+    "fill_text",
+    "clear_text",
+    "press_key",
+    "select_dropdown",
+    "hover",
+    "scroll_to",
+    "wait_for_element",
+    "wait_for_visible",
+    "wait_for_hidden",
+    "wait_for_attached",
+    "wait_for_detached",
+    "wait_for_enabled",
+    "wait_for_disabled",
+    "wait_for_text",
+    "assert_text",
+    "assert_contains_text",
+    "assert_visible",
+    "screenshot_element",
+    "switch_to_frame",
+})
+_VALUE_REQUIRED = frozenset({"fill_text", "select_dropdown", "press_key"})
+_EXPECTED_REQUIRED = frozenset({"wait_for_text", "assert_text", "assert_contains_text", "assert_title"})
+_URL_STATE = frozenset({"wait_for_url", "wait_for_load_state"})
 
 
 def validate_actions(actions: Iterable[str]) -> None:
     """Validate supported actions."""
-    unsupported = [action for action in actions if action not in REQUIRED_ACTIONS]
+    if isinstance(actions, (set, frozenset)):
+        unsupported = sorted(actions - REQUIRED_ACTIONS)
+    else:
+        unsupported = [action for action in actions if action not in REQUIRED_ACTIONS]
     if unsupported:
         raise ValueError(f"Unsupported actions: {unsupported}")
 
 
 def validate_step_fields(action: str, locator: str | None, value: str | None, expected: str | None) -> None:
     """Validate fields based on action type."""
-    if action in {
-        "click",
-        "double_click",
-        "right_click",
-        "fill_text",
-        "clear_text",
-        "press_key",
-        "select_dropdown",
-        "hover",
-        "scroll_to",
-        "wait_for_element",
-        "wait_for_visible",
-        "wait_for_hidden",
-        "wait_for_attached",
-        "wait_for_detached",
-        "wait_for_enabled",
-        "wait_for_disabled",
-        "wait_for_text",
-        "assert_text",
-        "assert_contains_text",
-        "assert_visible",
-        "screenshot_element",
-        "switch_to_frame",
-    }:
+    if action in _LOCATOR_REQUIRED:
         if not locator:
             raise ValueError(f"Locator is required for action: {action}")
-    if action in {"fill_text", "select_dropdown", "press_key"} and value is None:
+    if action in _VALUE_REQUIRED and value is None:
         raise ValueError(f"Value is required for action: {action}")
-    if action in {"wait_for_text", "assert_text", "assert_contains_text", "assert_title"} and expected is None and value is None:
+    if action in _EXPECTED_REQUIRED and expected is None and value is None:
         raise ValueError(f"Expected value is required for action: {action}")
-    if action in {"wait_for_url", "wait_for_load_state"} and expected is None and value is None:
+    if action in _URL_STATE and expected is None and value is None:
         raise ValueError(f"Expected value is required for action: {action}")
-    if action in {"switch_window"} and value is None and locator is None:
+    if action == "switch_window" and value is None and locator is None:
         raise ValueError("switch_window requires a window index in Locator or Value.")
     if action == "CALL_FLOW" and not (locator or value):
         raise ValueError("CALL_FLOW requires a flow name in Locator or Value.")
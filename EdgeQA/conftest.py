@@ -6,18 +6,78 @@ import html
 import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import pytest
 
-from utils.file_utils import ensure_dirs, resolve_path
+from utils.file_utils import ensure_dirs, link_or_copy, resolve_path
 
 pytest_plugins = ["core.base_test"]
 
 EDGEQA_REPORT_NAME = "edgeqa_report.html"
 
+_ROOT_DIR = os.path.abspath(os.path.dirname(__file__))
+_REPORTS_DIR = resolve_path(_ROOT_DIR, "reports")
+_HUMAN_DIR = resolve_path(_REPORTS_DIR, "human")
+_SCREENSHOTS_DIR = resolve_path(_REPORTS_DIR, "artifacts", "screenshots")
+_LOGS_DIR = resolve_path(_ROOT_DIR, "logs")
+
+_SCREENSHOT_RE_WIN = re.compile(r"screenshot=([A-Za-z]:\\\\[^\\s]+\\.png)")
+_SCREENSHOT_RE = re.compile(r"screenshot=([^\\s]+\\.png)")
+_SAFE_FN_RE = re.compile(r"[^a-zA-Z0-9_.-]+")
+_FAILED_RE = re.compile(r"Step failed:\s*(.+?)\s*\|\s*error")
+
+_REPORT_HEAD = """\
+<!doctype html>
+<html>
+<head>
+  <meta charset="utf-8">
+  <title>EdgeQA Report</title>
+  <style>
+    body { font-family: Arial, sans-serif; padding: 20px; background: #f6f7f9; }
+    h1 { margin-bottom: 8px; }
+    .summary { display: grid; grid-template-columns: repeat(4, auto); gap: 16px; margin-bottom: 20px; }
+    .card { background: #fff; border-radius: 8px; padding: 16px; margin-bottom: 16px; box-shadow: 0 1px 2px rgba(0,0,0,0.08); }
+    .card.failed { border-left: 4px solid #d9534f; }
+    .card.passed { border-left: 4px solid #5cb85c; }
+    .title { font-size: 16px; font-weight: bold; margin-bottom: 6px; }
+    .nodeid { font-size: 12px; color: #666; margin-bottom: 8px; }
+    .cause { margin-bottom: 10px; }
+    .steps ul { margin: 8px 0 0 18px; }
+    .steps li.failed { color: #d9534f; font-weight: bold; }
+    .log-snippet pre { background: #f3f4f6; padding: 10px; border-radius: 6px; overflow-x: auto; }
+    .badge { font-size: 11px; padding: 2px 6px; border-radius: 4px; color: #fff; margin-left: 6px; }
+    .badge.passed { background: #5cb85c; }
+    .badge.failed { background: #d9534f; }
+    .gallery { display: grid; grid-template-columns: repeat(auto-fill, minmax(240px, 1fr)); gap: 12px; }
+    .gallery img { width: 100%; border: 1px solid #ddd; border-radius: 6px; }
+    .gallery .item { background: #fff; padding: 8px; border-radius: 6px; box-shadow: 0 1px 2px rgba(0,0,0,0.06); }
+    .screenshot img { max-width: 100%; border: 1px solid #ddd; border-radius: 6px; }
+    .label { font-size: 12px; color: #444; margin-bottom: 6px; }
+    .ok { background: #e7f6ea; padding: 12px; border-radius: 6px; }
+  </style>
+</head>
+<body>
+  <h1>EdgeQA Report</h1>
+"""
+_REPORT_SUMMARY = """\
+<div class="summary">
+  <div><strong>Total:</strong> {total}</div>
+  <div><strong>Passed:</strong> {passed}</div>
+  <div><strong>Failed:</strong> {failed}</div>
+  <div><strong>Generated:</strong> {timestamp}</div>
+</div>
+"""
+_REPORT_TAIL = """\
+</body>
+</html>
+"""
+
+_FULL_PAGE_ON_FAILURE = os.getenv("EDGEQA_FULL_PAGE", "0") == "1"
+
 
 @dataclass
 class TestRecord:
@@ -28,24 +88,31 @@ class TestRecord:
     status: str
     root_cause: Optional[str]
     failed_step: Optional[str]
+    failed_index: Optional[int]
     steps: List[str]
     stderr: str
     error_snippet: str
     screenshot_path: Optional[str]
 
 
+# Per-session state lives on config.stash so in-process reruns (pytest.main) start clean.
+_TESTS_KEY = pytest.StashKey[Dict[str, TestRecord]]()
+_SCREENSHOT_WRITER_KEY = pytest.StashKey[ThreadPoolExecutor]()
+
+
 @pytest.hookimpl(tryfirst=True)
 def pytest_configure() -> None:
     """Ensure report and log directories exist before tests run."""
-    root_dir = os.path.abspath(os.path.dirname(__file__))
-    reports_dir = resolve_path(root_dir, "reports")
-    human_dir = resolve_path(reports_dir, "human")
-    screenshots_dir = resolve_path(reports_dir, "artifacts", "screenshots")
-    logs_dir = resolve_path(root_dir, "logs")
-    ensure_dirs([reports_dir, human_dir, logs_dir, screenshots_dir])
-    _clean_directory(screenshots_dir)
-    if not hasattr(pytest, "edgeqa_tests"):
-        pytest.edgeqa_tests = {}
+    ensure_dirs([_REPORTS_DIR, _HUMAN_DIR, _LOGS_DIR, _SCREENSHOTS_DIR])
+    _clean_directory(_SCREENSHOTS_DIR)
+
+
+def pytest_sessionstart(session) -> None:
+    """Create the per-session test records and screenshot writer."""
+    session.config.stash[_TESTS_KEY] = {}
+    session.config.stash[_SCREENSHOT_WRITER_KEY] = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="edgeqa-screenshot"
+    )
 
 
 @pytest.hookimpl(hookwrapper=True)
@@ -56,40 +123,39 @@ def pytest_runtest_makereport(item, call):
     if report.when != "call":
         return
 
-    root_dir = os.path.abspath(os.path.dirname(__file__))
-    reports_dir = resolve_path(root_dir, "reports")
-    human_dir = resolve_path(reports_dir, "human")
-
-    stderr_text = _extract_captured_text(report.sections, "Captured stderr call")
-    log_text = _extract_captured_text(report.sections, "Captured log call")
+    sections_by_name = dict(report.sections)
+    stderr_text = sections_by_name.get("Captured stderr call", "")
+    log_text = sections_by_name.get("Captured log call", "")
     combined_text = "\n".join([stderr_text, log_text]).strip()
-    steps = _extract_steps(combined_text)
-    failed_step = _extract_failed_step(combined_text)
+    steps, failed_step = _scan_log(combined_text)
+    failed_index = _find_failed_index(steps, failed_step) if report.failed else None
 
     screenshot_path = None
     if report.failed:
         if "page" in item.funcargs:
             page = item.funcargs["page"]
             filename = _safe_filename(report.nodeid) + ".png"
-            screenshot_path = resolve_path(human_dir, filename)
+            screenshot_path = resolve_path(_HUMAN_DIR, filename)
             try:
-                page.screenshot(path=screenshot_path, full_page=False)
+                data = page.screenshot(full_page=_FULL_PAGE_ON_FAILURE)
+                item.config.stash[_SCREENSHOT_WRITER_KEY].submit(_write_bytes, screenshot_path, data)
             except Exception:  # noqa: BLE001
                 screenshot_path = None
         else:
             screenshot_path = _extract_screenshot_path(report.longreprtext)
             if screenshot_path:
-                screenshot_path = _copy_screenshot(screenshot_path, human_dir)
+                screenshot_path = _copy_screenshot(screenshot_path, _HUMAN_DIR)
 
     root_cause = _extract_root_cause(report.longreprtext) if report.failed else None
     error_snippet = _simplify_error_log(combined_text)
 
-    pytest.edgeqa_tests[report.nodeid] = TestRecord(
+    item.config.stash[_TESTS_KEY][report.nodeid] = TestRecord(
         nodeid=report.nodeid,
         test_name=item.name,
         status="FAILED" if report.failed else "PASSED",
         root_cause=root_cause,
         failed_step=failed_step,
+        failed_index=failed_index,
         steps=steps,
         stderr=combined_text,
         error_snippet=error_snippet,
@@ -99,33 +165,34 @@ def pytest_runtest_makereport(item, call):
 
 def pytest_sessionfinish(session, exitstatus) -> None:
     """Generate a human-friendly HTML report for non-technical users."""
-    root_dir = os.path.abspath(os.path.dirname(__file__))
-    reports_dir = resolve_path(root_dir, "reports")
-    human_dir = resolve_path(reports_dir, "human")
-    screenshots_dir = resolve_path(reports_dir, "artifacts", "screenshots")
-    report_path = resolve_path(reports_dir, EDGEQA_REPORT_NAME)
+    report_path = resolve_path(_REPORTS_DIR, EDGEQA_REPORT_NAME)
+    stash = session.config.stash
+    stash[_SCREENSHOT_WRITER_KEY].shutdown(wait=True)
+    del stash[_SCREENSHOT_WRITER_KEY]
+    tests = stash[_TESTS_KEY]
+    del stash[_TESTS_KEY]
 
-    tests: Dict[str, TestRecord] = getattr(pytest, "edgeqa_tests", {})
     collected = getattr(session, "testscollected", 0)
     failed = len([test for test in tests.values() if test.status == "FAILED"])
     passed = max(collected - failed, 0)
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    all_screenshots = _collect_all_screenshots(screenshots_dir, human_dir)
-
-    html_content = _build_human_report(
-        timestamp=timestamp,
-        total=collected,
-        passed=passed,
-        failed=failed,
-        tests=list(tests.values()),
-        human_dir=human_dir,
-        all_screenshots=all_screenshots,
+    all_screenshots = _collect_all_screenshots(_SCREENSHOTS_DIR, _HUMAN_DIR)
+
+    _save_report(
+        report_path,
+        _generate_report(
+            timestamp=timestamp,
+            total=collected,
+            passed=passed,
+            failed=failed,
+            tests=list(tests.values()),
+            human_dir=_HUMAN_DIR,
+            all_screenshots=all_screenshots,
+        ),
     )
-    with open(report_path, "w", encoding="utf-8") as handle:
-        handle.write(html_content)
 
 
-def _build_human_report(
+def _generate_report(
     timestamp: str,
     total: int,
     passed: int,
@@ -133,108 +200,56 @@ def _build_human_report(
     tests: List[TestRecord],
     human_dir: str,
     all_screenshots: List[str],
-) -> str:
-    summary = f"""
-    <div class="summary">
-      <div><strong>Total:</strong> {total}</div>
-      <div><strong>Passed:</strong> {passed}</div>
-      <div><strong>Failed:</strong> {failed}</div>
-      <div><strong>Generated:</strong> {timestamp}</div>
-    </div>
-    """
-
-    failure_cards = []
-    passed_cards = []
-    for record in tests:
-        screenshot_block = ""
-        if record.screenshot_path and os.path.exists(record.screenshot_path):
-            rel_path = os.path.relpath(record.screenshot_path, human_dir)
-            screenshot_block = f"""
-            <div class="screenshot">
-              <div class="label">Screenshot</div>
-              <img src="human/{html.escape(rel_path)}" alt="Failure screenshot" />
-            </div>
-            """
-        steps_html = _build_steps_html(record.steps, record.failed_step)
-        error_section = ""
-        if record.status == "FAILED":
-            error_section = f"""
-            <div class="cause"><strong>Root Cause:</strong> {html.escape(record.root_cause or 'Unknown error')}</div>
-            <div class="cause"><strong>Failed Step:</strong> {html.escape(record.failed_step or 'Unknown step')}</div>
-            <div class="log-snippet"><strong>Error Log:</strong><pre>{html.escape(record.error_snippet)}</pre></div>
-            """
-
-        stderr_section = ""
-        if record.stderr:
-            stderr_section = f"""
-            <div class="log-snippet"><strong>Captured stderr call:</strong><pre>{html.escape(record.stderr)}</pre></div>
-            """
-
-        card_html = f"""
-        <div class="card {'failed' if record.status == 'FAILED' else 'passed'}">
-          <div class="title">{html.escape(record.test_name)} <span class="badge {record.status.lower()}">{record.status}</span></div>
-          <div class="nodeid">{html.escape(record.nodeid)}</div>
-          {error_section}
-          <div class="steps">
-            <strong>Steps:</strong>
-            {steps_html}
-          </div>
-          {stderr_section}
-          {screenshot_block}
-        </div>
-        """
-        if record.status == "FAILED":
-            failure_cards.append(card_html)
-        else:
-            passed_cards.append(card_html)
-
-    failures_html = "\n".join(failure_cards) if failure_cards else "<div class='ok'>No failures.</div>"
-    passed_html = "\n".join(passed_cards) if passed_cards else "<div class='ok'>No passed tests recorded.</div>"
-
-    screenshots_html = _build_all_screenshots_html(all_screenshots)
-
-    return f"""
-    <!doctype html>
-    <html>
-    <head>
-      <meta charset="utf-8">
-      <title>EdgeQA Report</title>
-      <style>
-        body {{ font-family: Arial, sans-serif; padding: 20px; background: #f6f7f9; }}
-        h1 {{ margin-bottom: 8px; }}
-        .summary {{ display: grid; grid-template-columns: repeat(4, auto); gap: 16px; margin-bottom: 20px; }}
-        .card {{ background: #fff; border-radius: 8px; padding: 16px; margin-bottom: 16px; box-shadow: 0 1px 2px rgba(0,0,0,0.08); }}
-        .card.failed {{ border-left: 4px solid #d9534f; }}
-        .card.passed {{ border-left: 4px solid #5cb85c; }}
-        .title {{ font-size: 16px; font-weight: bold; margin-bottom: 6px; }}
-        .nodeid {{ font-size: 12px; color: #666; margin-bottom: 8px; }}
-        .cause {{ margin-bottom: 10px; }}
-        .steps ul {{ margin: 8px 0 0 18px; }}
-        .steps li.failed {{ color: #d9534f; font-weight: bold; }}
-        .log-snippet pre {{ background: #f3f4f6; padding: 10px; border-radius: 6px; overflow-x: auto; }}
-        .badge {{ font-size: 11px; padding: 2px 6px; border-radius: 4px; color: #fff; margin-left: 6px; }}
-        .badge.passed {{ background: #5cb85c; }}
-        .badge.failed {{ background: #d9534f; }}
-        .gallery {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(240px, 1fr)); gap: 12px; }}
-        .gallery img {{ width: 100%; border: 1px solid #ddd; border-radius: 6px; }}
-        .gallery .item {{ background: #fff; padding: 8px; border-radius: 6px; box-shadow: 0 1px 2px rgba(0,0,0,0.06); }}
-        .screenshot img {{ max-width: 100%; border: 1px solid #ddd; border-radius: 6px; }}
-        .label {{ font-size: 12px; color: #444; margin-bottom: 6px; }}
-        .ok {{ background: #e7f6ea; padding: 12px; border-radius: 6px; }}
-      </style>
-    </head>
-    <body>
-      <h1>EdgeQA Report</h1>
-      {summary}
-      <h2>Failed Tests</h2>
-      {failures_html}
-      <h2>Passed Tests</h2>
-      {passed_html}
-      <h2>All Screenshots</h2>
-      {screenshots_html}
-    </body>
-    </html>
-    """
+) -> Iterator[str]:
+    yield _REPORT_HEAD
+    yield _REPORT_SUMMARY.format(total=total, passed=passed, failed=failed, timestamp=timestamp)
+
+    yield "<h2>Failed Tests</h2>\n"
+    if failed:
+        for record in tests:
+            if record.status == "FAILED":
+                yield from _iter_card(record, human_dir)
+    else:
+        yield "<div class='ok'>No failures.</div>\n"
+
+    yield "<h2>Passed Tests</h2>\n"
+    passed_records = [record for record in tests if record.status != "FAILED"] if failed else tests
+    if passed_records:
+        for record in passed_records:
+            yield from _iter_card(record, human_dir)
+    else:
+        yield "<div class='ok'>No passed tests recorded.</div>\n"
+
+    yield "<h2>All Screenshots</h2>\n"
+    yield _build_all_screenshots_html(all_screenshots)
+    yield _REPORT_TAIL
+
+
+def _save_report(path: str, chunks: Iterable[str]) -> None:
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as handle:
+        handle.writelines(chunks)
+
+
+def _iter_card(record: TestRecord, human_dir: str) -> Iterator[str]:
+    is_failed = record.status == "FAILED"
+    yield f"<div class=\"card {'failed' if is_failed else 'passed'}\">\n"
+    yield f"<div class=\"title\">{html.escape(record.test_name)} "
+    yield f"<span class=\"badge {record.status.lower()}\">{record.status}</span></div>\n"
+    yield f"<div class=\"nodeid\">{html.escape(record.nodeid)}</div>\n"
+    if is_failed:
+        yield f"<div class=\"cause\"><strong>Root Cause:</strong> {html.escape(record.root_cause or 'Unknown error')}</div>\n"
+        yield f"<div class=\"cause\"><strong>Failed Step:</strong> {html.escape(record.failed_step or 'Unknown step')}</div>\n"
+        yield f"<div class=\"log-snippet\"><strong>Error Log:</strong><pre>{html.escape(record.error_snippet)}</pre></div>\n"
+    yield "<div class=\"steps\">\n<strong>Steps:</strong>\n"
+    yield _build_steps_html(record.steps, record.failed_index)
+    yield "</div>\n"
+    if record.stderr:
+        yield f"<div class=\"log-snippet\"><strong>Captured stderr call:</strong><pre>{html.escape(record.stderr)}</pre></div>\n"
+    if record.screenshot_path and os.path.exists(record.screenshot_path):
+        rel_path = os.path.relpath(record.screenshot_path, human_dir)
+        yield "<div class=\"screenshot\">\n<div class=\"label\">Screenshot</div>\n"
+        yield f"<img src=\"human/{html.escape(rel_path)}\" alt=\"Failure screenshot\" />\n</div>\n"
+    yield "</div>\n"
 
 
 def _extract_root_cause(longreprtext: str) -> str:
@@ -248,59 +263,58 @@ def _extract_root_cause(longreprtext: str) -> str:
 
 
 def _extract_screenshot_path(text: str) -> Optional[str]:
-    match = re.search(r"screenshot=([A-Za-z]:\\\\[^\\s]+\\.png)", text)
+    match = _SCREENSHOT_RE_WIN.search(text)
     if match:
         return match.group(1)
-    match = re.search(r"screenshot=([^\\s]+\\.png)", text)
+    match = _SCREENSHOT_RE.search(text)
     if match:
         return match.group(1)
     return None
 
 
 def _copy_screenshot(path: str, human_dir: str) -> Optional[str]:
-    if not os.path.exists(path):
-        return None
-    ensure_dirs([human_dir])
     dest = resolve_path(human_dir, os.path.basename(path))
     try:
-        shutil.copyfile(path, dest)
+        link_or_copy(path, dest)
         return dest
     except Exception:  # noqa: BLE001
         return None
 
 
-def _safe_filename(text: str) -> str:
-    safe = re.sub(r"[^a-zA-Z0-9_.-]+", "_", text)
-    return safe.strip("_")
+def _write_bytes(path: str, data: bytes) -> None:
+    with open(path, "wb") as handle:
+        handle.write(data)
 
 
-def _extract_captured_text(sections: List[Tuple[str, str]], label: str) -> str:
-    for name, content in sections:
-        if name == label:
-            return content
-    return ""
+def _safe_filename(text: str) -> str:
+    safe = _SAFE_FN_RE.sub("_", text)
+    return safe.strip("_")
 
 
-def _extract_steps(text: str) -> List[str]:
+def _scan_log(text: str) -> Tuple[List[str], Optional[str]]:
     steps = []
+    failed_line = None
     for line in text.splitlines():
         if "Executing step:" in line:
             steps.append(line.split("Executing step:", 1)[1].strip())
         elif "[FLOW STEP]" in line:
             steps.append(line.split("[FLOW STEP]", 1)[1].strip())
-    return steps
-
-
-def _extract_failed_step(text: str) -> Optional[str]:
-    failed_line = None
-    for line in text.splitlines():
-        if "Step failed:" in line:
+        elif "Step failed:" in line:
             failed_line = line
     if failed_line:
-        match = re.search(r"Step failed:\s*(.+?)\s*\|\s*error", failed_line)
+        match = _FAILED_RE.search(failed_line)
         if match:
-            return match.group(1).strip()
-    return steps[-1] if (steps := _extract_steps(text)) else None
+            return steps, match.group(1).strip()
+    return steps, steps[-1] if steps else None
+
+
+def _find_failed_index(steps: List[str], failed_step: Optional[str]) -> Optional[int]:
+    if not failed_step:
+        return None
+    for index in range(len(steps) - 1, -1, -1):
+        if failed_step in steps[index]:
+            return index
+    return None
 
 
 def _simplify_error_log(text: str) -> str:
@@ -310,29 +324,32 @@ def _simplify_error_log(text: str) -> str:
     return "\n".join(text.splitlines()[-6:])
 
 
-def _build_steps_html(steps: List[str], failed_step: Optional[str]) -> str:
+def _build_steps_html(steps: List[str], failed_index: Optional[int]) -> str:
     if not steps:
         return "<div class='ok'>No steps captured.</div>"
     items = []
-    for step in steps:
-        css = "failed" if failed_step and failed_step in step else ""
+    for index, step in enumerate(steps):
+        css = "failed" if index == failed_index else ""
         items.append(f"<li class='{css}'>{html.escape(step)}</li>")
     return f"<ul>{''.join(items)}</ul>"
 
 
 def _collect_all_screenshots(screenshots_dir: str, human_dir: str) -> List[str]:
-    if not os.path.exists(screenshots_dir):
+    try:
+        with os.scandir(screenshots_dir) as entries:
+            sources = sorted(
+                (entry for entry in entries if entry.name.lower().endswith(".png") and entry.is_file()),
+                key=lambda entry: entry.name,
+            )
+    except FileNotFoundError:
         return []
     target_dir = resolve_path(human_dir, "all_screenshots")
     ensure_dirs([target_dir])
     paths = []
-    for name in sorted(os.listdir(screenshots_dir)):
-        if not name.lower().endswith(".png"):
-            continue
-        source = resolve_path(screenshots_dir, name)
-        dest = resolve_path(target_dir, name)
+    for entry in sources:
+        dest = resolve_path(target_dir, entry.name)
         try:
-            shutil.copyfile(source, dest)
+            link_or_copy(entry.path, dest)
             paths.append(dest)
         except Exception:  # noqa: BLE001
             continue
@@ -357,14 +374,15 @@ def _build_all_screenshots_html(paths: List[str]) -> str:
 
 
 def _clean_directory(path: str) -> None:
-    if not os.path.exists(path):
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.remove(entry.path)
+                except OSError:
+                    continue
+    except FileNotFoundError:
         return
-    for name in os.listdir(path):
-        item = os.path.join(path, name)
-        try:
-            if os.path.isfile(item):
-                os.remove(item)
-            elif os.path.isdir(item):
-                shutil.rmtree(item)
-        except Exception:  # noqa: BLE001
-            continue
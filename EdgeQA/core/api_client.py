@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import json
+from typing import Any, Dict, Optional, Union
 
 import requests
-from playwright.sync_api import APIRequestContext, Playwright, sync_playwright
+from playwright.sync_api import APIRequestContext, APIResponse, Playwright, sync_playwright
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 
 class ApiClient:
@@ -17,6 +25,7 @@ class ApiClient:
         self.playwright: Optional[Playwright] = playwright
         self._owns_playwright = playwright is None
         self.request_context: Optional[APIRequestContext] = None
+        self.session = requests.Session()
 
     def start(self) -> None:
         """Start Playwright API request context."""
@@ -25,60 +34,89 @@ class ApiClient:
         self.request_context = self.playwright.request.new_context(base_url=self.base_url, timeout=self.timeout_ms)
 
     def stop(self) -> None:
-        """Stop Playwright API context."""
+        """Stop Playwright API context and close pooled HTTP connections."""
         if self.request_context:
             self.request_context.dispose()
         if self.playwright and self._owns_playwright:
             self.playwright.stop()
+        self.session.close()
 
-    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> ApiResponse:
         """Perform GET request."""
         if self.request_context:
             response = self.request_context.get(path, params=params)
-            return _to_requests_response(response)
-        return requests.get(f"{self.base_url}{path}", params=params, timeout=self.timeout_ms / 1000)
+            return _PWResponse(response)
+        return self.session.get(f"{self.base_url}{path}", params=params, timeout=self.timeout_ms / 1000)
 
-    def post(self, path: str, json_body: Optional[Dict[str, Any]] = None) -> requests.Response:
+    def post(self, path: str, json_body: Optional[Dict[str, Any]] = None) -> ApiResponse:
         """Perform POST request."""
         if self.request_context:
             response = self.request_context.post(path, json=json_body)
-            return _to_requests_response(response)
-        return requests.post(f"{self.base_url}{path}", json=json_body, timeout=self.timeout_ms / 1000)
+            return _PWResponse(response)
+        return self.session.post(f"{self.base_url}{path}", json=json_body, timeout=self.timeout_ms / 1000)
 
-    def put(self, path: str, json_body: Optional[Dict[str, Any]] = None) -> requests.Response:
+    def put(self, path: str, json_body: Optional[Dict[str, Any]] = None) -> ApiResponse:
         """Perform PUT request."""
         if self.request_context:
             response = self.request_context.put(path, json=json_body)
-            return _to_requests_response(response)
-        return requests.put(f"{self.base_url}{path}", json=json_body, timeout=self.timeout_ms / 1000)
+            return _PWResponse(response)
+        return self.session.put(f"{self.base_url}{path}", json=json_body, timeout=self.timeout_ms / 1000)
 
-    def delete(self, path: str, json_body: Optional[Dict[str, Any]] = None) -> requests.Response:
+    def delete(self, path: str, json_body: Optional[Dict[str, Any]] = None) -> ApiResponse:
         """Perform DELETE request."""
         if self.request_context:
             response = self.request_context.delete(path, json=json_body)
-            return _to_requests_response(response)
-        return requests.delete(f"{self.base_url}{path}", json=json_body, timeout=self.timeout_ms / 1000)
+            return _PWResponse(response)
+        return self.session.delete(f"{self.base_url}{path}", json=json_body, timeout=self.timeout_ms / 1000)
 
-    def patch(self, path: str, json_body: Optional[Dict[str, Any]] = None) -> requests.Response:
+    def patch(self, path: str, json_body: Optional[Dict[str, Any]] = None) -> ApiResponse:
         """Perform PATCH request."""
         if self.request_context:
             response = self.request_context.patch(path, json=json_body)
-            return _to_requests_response(response)
-        return requests.patch(f"{self.base_url}{path}", json=json_body, timeout=self.timeout_ms / 1000)
+            return _PWResponse(response)
+        return self.session.patch(f"{self.base_url}{path}", json=json_body, timeout=self.timeout_ms / 1000)
 
-    def head(self, path: str) -> requests.Response:
+    def head(self, path: str) -> ApiResponse:
         """Perform HEAD request."""
         if self.request_context:
             response = self.request_context.head(path)
-            return _to_requests_response(response)
-        return requests.head(f"{self.base_url}{path}", timeout=self.timeout_ms / 1000)
-
-
-def _to_requests_response(playwright_response) -> requests.Response:
-    """Convert Playwright response to requests.Response compatible object."""
-    response = requests.Response()
-    response.status_code = playwright_response.status
-    response._content = playwright_response.body()
-    response.headers = playwright_response.headers
-    response.url = playwright_response.url
-    return response
+            return _PWResponse(response)
+        return self.session.head(f"{self.base_url}{path}", timeout=self.timeout_ms / 1000)
+
+
+class _PWResponse:
+    """Lightweight requests-like view over a Playwright API response."""
+
+    __slots__ = ("_response", "_body")
+
+    def __init__(self, response: APIResponse) -> None:
+        self._response = response
+        self._body: Optional[bytes] = None
+
+    @property
+    def status_code(self) -> int:
+        return self._response.status
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return self._response.headers
+
+    @property
+    def url(self) -> str:
+        return self._response.url
+
+    @property
+    def content(self) -> bytes:
+        if self._body is None:
+            self._body = self._response.body()
+        return self._body
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return _json_loads(self.content)
+
+
+ApiResponse = Union[requests.Response, _PWResponse]
@@ -6,6 +6,7 @@ import os
 from typing import Dict, Generator
 
 import pytest
+from playwright.sync_api import sync_playwright
 
 from core.constants import ENV_VAR_ENV, ENV_VAR_BROWSER
 from core.driver_factory import create_playwright_manager
@@ -13,35 +14,58 @@ from utils.config_loader import load_config
 from utils.file_utils import ensure_dirs, resolve_path
 from utils.logger import get_logger
 
+_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+_REPORTS_DIR = resolve_path(_ROOT_DIR, "reports")
+_ARTIFACTS_DIR = resolve_path(_REPORTS_DIR, "artifacts")
+_DIRS_READY = False
+
 
 @pytest.fixture(scope="session")
 def framework_config() -> Dict[str, object]:
     """Session-scoped framework configuration."""
-    root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    return load_config(root_dir)
+    return load_config(_ROOT_DIR)
 
 
 @pytest.fixture(scope="session")
 def logger(framework_config: Dict[str, object]):
     """Session-scoped logger."""
-    logs_dir = resolve_path(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")), "logs")
+    logs_dir = resolve_path(_ROOT_DIR, "logs")
     return get_logger("edgeqa", logs_dir=logs_dir)
 
 
+@pytest.fixture(scope="session")
+def playwright_session() -> Generator:
+    """Session-scoped Playwright driver shared by API clients."""
+    with sync_playwright() as playwright:
+        yield playwright
+
+
+@pytest.fixture(scope="session")
+def browser_session(framework_config: Dict[str, object], playwright_session) -> Generator:
+    """Session-scoped browser shared by every page in this worker."""
+    config = framework_config
+    browser_name = os.getenv(ENV_VAR_BROWSER, config["browser_name"])
+    manager = create_playwright_manager(browser_name, config["browser"], _ARTIFACTS_DIR)
+    browser = manager.launch_browser(playwright_session)
+    yield browser
+    browser.close()
+
+
 @pytest.fixture(scope="function")
-def page(framework_config: Dict[str, object], logger) -> Generator:
+def page(framework_config: Dict[str, object], logger, browser_session) -> Generator:
     """Provide a Playwright page with managed lifecycle."""
+    global _DIRS_READY
     config = framework_config
-    root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    reports_dir = resolve_path(root_dir, "reports")
-    artifacts_dir = resolve_path(reports_dir, "artifacts")
-    ensure_dirs([reports_dir, artifacts_dir])
+    if not _DIRS_READY:
+        ensure_dirs([_REPORTS_DIR, _ARTIFACTS_DIR])
+        _DIRS_READY = True
+    artifacts_dir = _ARTIFACTS_DIR
 
     browser_name = os.getenv(ENV_VAR_BROWSER, config["browser_name"])
     browser_config = config["browser"]
     record_video = bool(config["config"]["video"]["enabled"])
     manager = create_playwright_manager(browser_name, browser_config, artifacts_dir, record_video=record_video)
-    page_instance = manager.start()
+    page_instance = manager.start(browser=browser_session)
 
     yield page_instance
 
@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from core.commands.base_command import BaseCommand
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class ApiCallCommand(BaseCommand):
     """Perform API request using ApiClient."""
@@ -22,27 +29,27 @@ class ApiCallCommand(BaseCommand):
         response = _dispatch(api_client, method, endpoint, payload)
         context.set("LAST_RESPONSE", response)
         try:
-            context.set("LAST_RESPONSE_JSON", response.json())
+            context.set("LAST_RESPONSE_JSON", _json_loads(response.content))
         except Exception:  # noqa: BLE001
             context.set("LAST_RESPONSE_JSON", {})
         return response
 
 
+_METHODS: Dict[str, Callable[[Any, str, Dict[str, Any]], Any]] = {
+    "GET": lambda client, endpoint, payload: client.get(endpoint),
+    "POST": lambda client, endpoint, payload: client.post(endpoint, json_body=payload),
+    "PUT": lambda client, endpoint, payload: client.put(endpoint, json_body=payload),
+    "DELETE": lambda client, endpoint, payload: client.delete(endpoint, json_body=payload),
+    "PATCH": lambda client, endpoint, payload: client.patch(endpoint, json_body=payload),
+    "HEAD": lambda client, endpoint, payload: client.head(endpoint),
+}
+
+
 def _dispatch(api_client, method: str, endpoint: str, payload: Dict[str, Any]):
-    method_upper = method.upper()
-    if method_upper == "GET":
-        return api_client.get(endpoint)
-    if method_upper == "POST":
-        return api_client.post(endpoint, json_body=payload)
-    if method_upper == "PUT":
-        return api_client.put(endpoint, json_body=payload)
-    if method_upper == "DELETE":
-        return api_client.delete(endpoint, json_body=payload)
-    if method_upper == "PATCH":
-        return api_client.patch(endpoint, json_body=payload)
-    if method_upper == "HEAD":
-        return api_client.head(endpoint)
-    raise ValueError(f"InvalidCommandException: COMMAND '{method}' not supported")
+    handler = _METHODS.get(method.upper())
+    if handler is None:
+        raise ValueError(f"InvalidCommandException: COMMAND '{method}' not supported")
+    return handler(api_client, endpoint, payload)
 
 
 def _parse_api_data(target: str | None, data: str | None):
@@ -51,14 +58,15 @@ def _parse_api_data(target: str | None, data: str | None):
     method = "GET"
 
     if data:
-        try:
-            parsed = json.loads(data)
-            method = str(parsed.get("method", method))
-            endpoint = str(parsed.get("endpoint", endpoint))
-            payload = parsed.get("payload", {}) or {}
-            return method, endpoint, payload
-        except json.JSONDecodeError:
-            pass
+        if data.lstrip().startswith("{"):
+            try:
+                parsed = _json_loads(data)
+                method = str(parsed.get("method", method))
+                endpoint = str(parsed.get("endpoint", endpoint))
+                payload = parsed.get("payload", {}) or {}
+                return method, endpoint, payload
+            except json.JSONDecodeError:
+                pass
 
         parts = data.split()
         if parts:
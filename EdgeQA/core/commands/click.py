@@ -12,5 +12,5 @@ class ClickCommand(BaseCommand):
 
     def execute(self, target: str | None, data: str | None, context):
         page = context.get("page")
-        page.click(target, timeout=context.get("TIMEOUT_MS", 10000))
+        page.click(target, timeout=context.timeout_ms)
         return target
@@ -15,11 +15,6 @@ class OpenUrlCommand(BaseCommand):
         base_url = context.get("BASE_URL", "")
         url = data or target or ""
         if url and not url.startswith("http"):
-            if base_url.endswith("/") and url.startswith("/"):
-                url = base_url[:-1] + url
-            elif not base_url.endswith("/") and not url.startswith("/"):
-                url = f"{base_url}/{url}"
-            else:
-                url = base_url + url
-        page.goto(url, timeout=context.get("TIMEOUT_MS", 10000))
+            url = f"{base_url.rstrip('/')}/{url.lstrip('/')}"
+        page.goto(url, timeout=context.timeout_ms)
         return url
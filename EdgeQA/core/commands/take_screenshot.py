@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
 import os
 from datetime import datetime
 
@@ -9,6 +11,9 @@ from core.commands.base_command import BaseCommand
 from core.constants import SCREENSHOTS_DIR_NAME
 from utils.file_utils import ensure_dir, resolve_path
 
+_SESSION_TS = datetime.now().strftime("%Y%m%d_%H%M%S")
+_COUNTER = itertools.count()
+
 
 class TakeScreenshotCommand(BaseCommand):
     """Capture a full-page screenshot."""
@@ -20,10 +25,15 @@ class TakeScreenshotCommand(BaseCommand):
         artifacts_dir = context.get("ARTIFACTS_DIR")
         if not artifacts_dir:
             artifacts_dir = resolve_path(os.getcwd(), "reports", "artifacts")
-        screenshots_dir = ensure_dir(os.path.join(artifacts_dir, SCREENSHOTS_DIR_NAME))
-        filename = data or f"dsl_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.png"
+        screenshots_dir = _screenshots_dir(artifacts_dir)
+        filename = data or f"dsl_{_SESSION_TS}_{os.getpid()}_{next(_COUNTER)}.png"
         if not filename.lower().endswith(".png"):
             filename += ".png"
         path = os.path.join(screenshots_dir, filename)
         page.screenshot(path=path, full_page=True)
         return path
+
+
+@functools.lru_cache(maxsize=8)
+def _screenshots_dir(artifacts_dir: str) -> str:
+    return ensure_dir(os.path.join(artifacts_dir, SCREENSHOTS_DIR_NAME))
@@ -12,5 +12,5 @@ class TypeTextCommand(BaseCommand):
 
     def execute(self, target: str | None, data: str | None, context):
         page = context.get("page")
-        page.fill(target, data or "", timeout=context.get("TIMEOUT_MS", 10000))
+        page.fill(target, data or "", timeout=context.timeout_ms)
         return data
@@ -5,7 +5,10 @@ from __future__ import annotations
 import re
 import time
 from dataclasses import dataclass
-from typing import Optional
+from enum import IntEnum
+from typing import Any, Dict, Optional, Tuple
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 
 @dataclass
@@ -16,51 +19,121 @@ class ConditionResult:
     retry_count: int
 
 
+class ConditionKind(IntEnum):
+    """Condition kinds recognised in the CONDITION column."""
+
+    NONE = 0
+    IF_EXISTS = 1
+    IF_NOT_EXISTS = 2
+    WAIT_UNTIL = 3
+
+
+@dataclass(frozen=True)
+class ParsedCondition:
+    """Condition parsed once at sheet-load time."""
+
+    kind: ConditionKind
+    retry_count: int
+
+
+NO_CONDITION = ParsedCondition(ConditionKind.NONE, 0)
+
+_KIND_PATTERN = re.compile(r"IF_NOT_EXISTS|IF_EXISTS|WAIT_UNTIL")
+_PARSE_CACHE: Dict[str, ParsedCondition] = {}
+_PARSE_CACHE_MAX = 256
+_LOCATOR_CACHE_MAX = 256
+
+
+def parse_condition(condition: Optional[str]) -> ParsedCondition:
+    """Parse a condition string into its kind and retry count."""
+    if not condition:
+        return NO_CONDITION
+    parsed = _PARSE_CACHE.get(condition)
+    if parsed is not None:
+        return parsed
+    normalized = condition.strip().upper()
+    kind_match = _KIND_PATTERN.match(normalized)
+    parsed = ParsedCondition(
+        kind=ConditionKind[kind_match.group(0)] if kind_match else ConditionKind.NONE,
+        retry_count=_parse_retry(normalized),
+    )
+    if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX:
+        _PARSE_CACHE.clear()
+    _PARSE_CACHE[condition] = parsed
+    return parsed
+
+
+def _parse_retry(normalized: str) -> int:
+    start = normalized.find("RETRY(")
+    while start != -1:
+        start += len("RETRY(")
+        end = normalized.find(")", start)
+        if end == -1:
+            return 0
+        digits = normalized[start:end]
+        if digits.isdecimal():
+            return int(digits)
+        start = normalized.find("RETRY(", start)
+    return 0
+
+
 class ConditionEvaluator:
     """Evaluate DSL condition expressions."""
 
-    _retry_pattern = re.compile(r"RETRY\((\d+)\)", re.IGNORECASE)
-
     def __init__(self, timeout_ms: int = 10000) -> None:
         self.timeout_ms = timeout_ms
+        self._locator_cache: Dict[Tuple[Any, str], Any] = {}
 
     def evaluate(self, condition: Optional[str], target_resolved: Optional[str], context) -> ConditionResult:
         """Evaluate condition string and return result."""
-        if not condition:
-            return ConditionResult(should_execute=True, retry_count=0)
-
-        normalized = condition.strip().upper()
-        retry_match = self._retry_pattern.search(normalized)
-        retry_count = int(retry_match.group(1)) if retry_match else 0
+        return self.evaluate_parsed(parse_condition(condition), target_resolved, context)
 
-        if normalized.startswith("IF_EXISTS"):
-            exists = self._exists(target_resolved, context)
-            return ConditionResult(should_execute=exists, retry_count=retry_count)
-        if normalized.startswith("IF_NOT_EXISTS"):
-            exists = self._exists(target_resolved, context)
-            return ConditionResult(should_execute=not exists, retry_count=retry_count)
-        if normalized.startswith("WAIT_UNTIL"):
-            self._wait_until(target_resolved, context)
-            return ConditionResult(should_execute=True, retry_count=retry_count)
-
-        return ConditionResult(should_execute=True, retry_count=retry_count)
+    def evaluate_parsed(self, parsed: ParsedCondition, target_resolved: Optional[str], context) -> ConditionResult:
+        """Evaluate a pre-parsed condition and return result."""
+        kind = parsed.kind
+        if kind == ConditionKind.NONE:
+            return ConditionResult(should_execute=True, retry_count=parsed.retry_count)
+        if kind == ConditionKind.IF_EXISTS:
+            return ConditionResult(should_execute=self._exists(target_resolved, context), retry_count=parsed.retry_count)
+        if kind == ConditionKind.IF_NOT_EXISTS:
+            return ConditionResult(should_execute=not self._exists(target_resolved, context), retry_count=parsed.retry_count)
+        self._wait_until(target_resolved, context)
+        return ConditionResult(should_execute=True, retry_count=parsed.retry_count)
 
     def _exists(self, target_resolved: Optional[str], context) -> bool:
         page = context.get("page")
         if not page or not target_resolved:
             return False
         try:
-            return page.locator(target_resolved).count() > 0
+            return self._locator(page, target_resolved).count() > 0
         except Exception:  # noqa: BLE001
             return False
 
+    def _locator(self, page, target_resolved: str):
+        key = (page, target_resolved)
+        locator = self._locator_cache.get(key)
+        if locator is None:
+            if len(self._locator_cache) >= _LOCATOR_CACHE_MAX:
+                self._locator_cache.clear()
+            locator = self._locator_cache[key] = page.locator(target_resolved)
+        return locator
+
     def _wait_until(self, target_resolved: Optional[str], context) -> None:
         page = context.get("page")
         if not page or not target_resolved:
             return
+        try:
+            self._locator(page, target_resolved).first.wait_for(state="attached", timeout=self.timeout_ms)
+            return
+        except PlaywrightTimeoutError:
+            raise TimeoutError(f"Condition WAIT_UNTIL timed out for target: {target_resolved}") from None
+        except Exception:  # noqa: BLE001
+            pass
         end_time = time.monotonic() + (self.timeout_ms / 1000)
+        delay = 0.01
         while time.monotonic() < end_time:
             if self._exists(target_resolved, context):
                 return
-            time.sleep(0.2)
+            time.sleep(delay)
+            delay = min(delay * 2, 0.1)
         raise TimeoutError(f"Condition WAIT_UNTIL timed out for target: {target_resolved}")
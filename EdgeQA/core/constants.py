@@ -6,6 +6,8 @@ ENV_VAR_ENV = "EDGEQA_ENV"
 ENV_VAR_BROWSER = "EDGEQA_BROWSER"
 ENV_VAR_CODELESS_SUITE = "EDGEQA_CODELESS_SUITE"
 ENV_VAR_TAGS = "EDGEQA_TAGS"
+ENV_VAR_XDIST_WORKERS = "EDGEQA_XDIST_WORKERS"
+MAX_PARALLEL_WORKERS = 8
 ARTIFACTS_DIR_NAME = "artifacts"
 SCREENSHOTS_DIR_NAME = "screenshots"
 VIDEO_DIR_NAME = "video"
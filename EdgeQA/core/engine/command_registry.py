@@ -23,3 +23,10 @@ class CommandRegistry:
         if key not in self._commands:
             raise ValueError(f"InvalidCommandException: COMMAND '{name}' not supported")
         return self._commands[key]
+
+    def get_upper(self, key: str) -> BaseCommand:
+        """Retrieve a command by an already upper-cased name."""
+        command = self._commands.get(key)
+        if command is None:
+            raise ValueError(f"InvalidCommandException: COMMAND '{key}' not supported")
+        return command
@@ -5,18 +5,54 @@ from __future__ import annotations
 import re
 from typing import Any, Dict, Optional
 
+_TEMPLATE_CACHE: Dict[str, Optional[str]] = {}
+_MISSING = object()
+_TEMPLATE_CACHE_MAX = 512
+_RESOLVE_CACHE_MAX = 1024
+
+
+class _MissingAsEmpty:
+    """Mapping view for str.format_map that renders unknown names as empty strings."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self._data = data
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data.get(key, "")
+
 
 class ContextStore:
     """Store and resolve runtime variables for DSL execution."""
 
+    __slots__ = ("_data", "_view", "_resolve_cache", "timeout_ms")
+
     _pattern = re.compile(r"\$\{([^}]+)\}")
 
     def __init__(self, initial: Optional[Dict[str, Any]] = None) -> None:
         self._data: Dict[str, Any] = initial or {}
+        self._view = _MissingAsEmpty(self._data)
+        self._resolve_cache: Dict[str, str] = {}
+        self.timeout_ms = int(self._data.get("TIMEOUT_MS", 10000))
 
     def set(self, key: str, value: Any) -> None:
         """Set a context variable."""
         self._data[key] = value
+        if self._resolve_cache:
+            self._resolve_cache.clear()
+        if key == "TIMEOUT_MS":
+            self.timeout_ms = int(value)
+
+    def update(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Set several variables at once and return their previous values."""
+        previous = {key: self._data.get(key) for key in values}
+        self._data.update(values)
+        if self._resolve_cache:
+            self._resolve_cache.clear()
+        if "TIMEOUT_MS" in values:
+            self.timeout_ms = int(values["TIMEOUT_MS"])
+        return previous
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a context variable."""
@@ -28,13 +64,45 @@ class ContextStore:
             return None
         if not isinstance(text, str):
             return str(text)
+        if "${" not in text:
+            return text
+        resolved = self._resolve_cache.get(text)
+        if resolved is not None:
+            return resolved
+        # Single lookup: another worker thread may clear the shared cache at any time.
+        template = _TEMPLATE_CACHE.get(text, _MISSING)
+        if template is _MISSING:
+            template = self._compile_template(text)
+        if template is None:
+            resolved = self._pattern.sub(self._replace_match, text)
+        else:
+            resolved = template.format_map(self._view)
+        if len(self._resolve_cache) >= _RESOLVE_CACHE_MAX:
+            self._resolve_cache.clear()
+        self._resolve_cache[text] = resolved
+        return resolved
 
-        def _replace(match) -> str:
+    def _compile_template(self, text: str) -> Optional[str]:
+        parts = []
+        position = 0
+        template: Optional[str] = None
+        for match in self._pattern.finditer(text):
             name = match.group(1)
-            value = self.get(name, "")
-            return str(value)
+            if not name.isidentifier():
+                break
+            parts.append(text[position:match.start()].replace("{", "{{").replace("}", "}}"))
+            parts.append(f"{{{name}}}")
+            position = match.end()
+        else:
+            parts.append(text[position:].replace("{", "{{").replace("}", "}}"))
+            template = "".join(parts)
+        if len(_TEMPLATE_CACHE) >= _TEMPLATE_CACHE_MAX:
+            _TEMPLATE_CACHE.clear()
+        _TEMPLATE_CACHE[text] = template
+        return template
 
-        return self._pattern.sub(_replace, text)
+    def _replace_match(self, match) -> str:
+        return str(self._data.get(match.group(1), ""))
 
     def to_dict(self) -> Dict[str, Any]:
         """Return a shallow copy of context data."""
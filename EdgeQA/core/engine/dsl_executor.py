@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from openpyxl import load_workbook
 
@@ -19,18 +22,35 @@ from core.commands.type_text import TypeTextCommand
 from core.commands.verify_status import VerifyStatusCommand
 from core.commands.verify_text import VerifyTextCommand
 from core.commands.verify_visible import VerifyVisibleCommand
-from core.conditions.condition_evaluator import ConditionEvaluator
+from core.conditions.condition_evaluator import ConditionEvaluator, ParsedCondition, parse_condition
 from core.engine.command_registry import CommandRegistry
 from core.engine.context_store import ContextStore
 from core.engine.hook_executor import HookExecutor
 from core.locator.locator_loader import load_locator_repository
 from core.locator.locator_resolver import LocatorResolver
 from core.playwright_manager import PlaywrightManager
+from utils.concurrency_utils import drain_queue, is_event_loop_running
 from utils.config_loader import load_config
 from utils.file_utils import ensure_dirs, resolve_path
 from utils.logger import get_logger
 from utils.dsl_report import TestRecord, clean_screenshots, safe_name, summarize_error, write_report
 
+_EXECUTE_VALUES = frozenset({"Y", "YES", "TRUE", "1"})
+_NON_LOCATOR_COMMANDS = frozenset({"OPEN_URL", "API_CALL"})
+_FLOW_CACHE_MAX = 64
+_COMMAND_CLASSES = (
+    OpenUrlCommand,
+    ClickCommand,
+    TypeTextCommand,
+    VerifyTextCommand,
+    VerifyVisibleCommand,
+    CallFlowCommand,
+    ApiCallCommand,
+    VerifyStatusCommand,
+    StoreResponseCommand,
+    TakeScreenshotCommand,
+)
+
 
 @dataclass
 class StepRow:
@@ -44,6 +64,22 @@ class StepRow:
     condition: str
     store: str
     failure_category: str
+    enabled: bool = field(init=False)
+    command_upper: str = field(init=False)
+    uses_locator: bool = field(init=False)
+    parsed_condition: ParsedCondition = field(init=False)
+    screenshot_stem: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.enabled = not self.execute or self.execute.upper() in _EXECUTE_VALUES
+        self.command_upper = self.command.upper()
+        self.uses_locator = self.command_upper not in _NON_LOCATOR_COMMANDS
+        self.parsed_condition = parse_condition(self.condition)
+        self.screenshot_stem = f"{safe_name(self.command)}_{safe_name(self.seq or 'step')}"
+
+
+_FLOW_CACHE: Dict[Tuple[str, float], List[StepRow]] = {}
+_FLOW_CACHE_LOCK = threading.Lock()
 
 
 class DslExecutor:
@@ -54,13 +90,15 @@ class DslExecutor:
         root_dir: str,
         locator_repo_path: Optional[str] = None,
         flows_dir: Optional[str] = None,
+        workers: Optional[int] = None,
     ) -> None:
         self.root_dir = root_dir
         self.config = load_config(root_dir)
+        self.workers = workers
         self.logger = get_logger("edgeqa_dsl", logs_dir=resolve_path(root_dir, "logs"))
         self.locator_repo_path = locator_repo_path or resolve_path(root_dir, "InputSheet", "LocatorRepository.xlsx")
         self.flows_dir = flows_dir or resolve_path(root_dir, "flows")
-        self._flow_depth = 0
+        self._local = threading.local()
         self._max_flow_depth = 3
 
         ensure_dirs([self.flows_dir])
@@ -70,15 +108,47 @@ class DslExecutor:
 
     def execute(self, testcases_path: str) -> None:
         """Execute test cases from the provided Excel file."""
-        workbook = load_workbook(testcases_path)
-        testcases_sheet = workbook["TestCases"]
-        testcases = self._read_testcases(testcases_sheet)
+        workbook = load_workbook(testcases_path, read_only=True, data_only=True)
+        try:
+            testcases = [tc for tc in self._read_testcases(workbook["TestCases"]) if tc["execute"] == "Y"]
+            sheets = self._preload_sheets(workbook, testcases)
+        finally:
+            workbook.close()
 
         reports_dir = resolve_path(self.root_dir, "reports")
         artifacts_dir = resolve_path(reports_dir, "artifacts")
         ensure_dirs([reports_dir, artifacts_dir])
         clean_screenshots(self.root_dir)
 
+        pending: "queue.SimpleQueue[Tuple[int, Dict[str, str]]]" = queue.SimpleQueue()
+        for item in enumerate(testcases):
+            pending.put(item)
+        workers = self.workers or int(self.config["config"].get("parallel", {}).get("workers", 1) or 1)
+        pool_size = min(workers, len(testcases))
+        if pool_size > 1:
+            with ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="edgeqa-dsl") as pool:
+                futures = [pool.submit(self._run_testcases, drain_queue(pending), sheets, artifacts_dir) for _ in range(pool_size)]
+            results = [result for future in futures for result in future.result()]
+            results.sort(key=lambda result: result[0])
+        elif is_event_loop_running():
+            # The sync Playwright API refuses to start inside a running loop; hand the run to a worker thread.
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="edgeqa-dsl") as pool:
+                results = pool.submit(self._run_testcases, drain_queue(pending), sheets, artifacts_dir).result()
+        else:
+            results = self._run_testcases(drain_queue(pending), sheets, artifacts_dir)
+
+        write_report(self.root_dir, [record for _, record, _ in results])
+        errors = [error for _, _, error in results if error is not None]
+        if errors:
+            raise errors[0]
+
+    def _run_testcases(
+        self,
+        testcases: Iterable[Tuple[int, Dict[str, str]]],
+        sheets: Dict[str, List[StepRow]],
+        artifacts_dir: str,
+    ) -> List[Tuple[int, TestRecord, Optional[Exception]]]:
+        """Run test cases sequentially on a browser session owned by the current thread."""
         browser_name = self.config["browser_name"]
         browser_config = self.config["browser"]
         env = self.config["environment"]
@@ -93,15 +163,12 @@ class DslExecutor:
         )
         api_client.start()
 
+        results: List[Tuple[int, TestRecord, Optional[Exception]]] = []
         try:
             context = self._build_context(page, api_client)
             context.set("screenshot_func", manager.screenshot_on_failure)
             hook_executor = HookExecutor(self)
-            report_records: List[TestRecord] = []
-            errors: List[Exception] = []
-            for tc in testcases:
-                if tc["execute"] != "Y":
-                    continue
+            for index, tc in testcases:
                 self.logger.info("DSL TestCase: %s", tc["id"])
                 steps_log: List[str] = []
                 failed_step = None
@@ -109,46 +176,49 @@ class DslExecutor:
                 screenshot_path = None
                 status = "PASSED"
                 failure_entries: List[dict] = []
+                error: Optional[Exception] = None
                 try:
-                    hook_executor.execute_hook(tc.get("before_hook"), workbook, context=context)
+                    hook_executor.execute_hook(tc.get("before_hook"), sheets, context=context)
                     self.execute_steps_sheet(
-                        workbook,
+                        sheets,
                         tc["steps_sheet"],
                         context=context,
                         steps_log=steps_log,
                         failure_entries=failure_entries,
                     )
-                    hook_executor.execute_hook(tc.get("after_hook"), workbook, context=context)
+                    hook_executor.execute_hook(tc.get("after_hook"), sheets, context=context)
                 except Exception as exc:  # noqa: BLE001
                     status = "FAILED"
                     root_cause = str(exc)
                     failed_step = steps_log[-1] if steps_log else None
                     filename = f"{safe_name(tc['id'])}"
                     screenshot_path = manager.screenshot_on_failure(filename)
-                    errors.append(exc)
+                    error = exc
                 finally:
                     if failure_entries and status != "FAILED":
                         status = "FAILED"
-                    report_records.append(
-                        TestRecord(
-                            nodeid=tc["id"],
-                            test_name=tc["id"],
-                            status=status,
-                            root_cause=root_cause,
-                            failed_step=failed_step,
-                            steps=steps_log,
-                            stderr="",
-                            error_snippet=summarize_error(root_cause or ""),
-                            screenshot_path=screenshot_path,
-                            failure_entries=failure_entries,
-                        )
+                    record = TestRecord(
+                        nodeid=tc["id"],
+                        test_name=tc["id"],
+                        status=status,
+                        root_cause=root_cause,
+                        failed_step=failed_step,
+                        steps=steps_log,
+                        stderr="",
+                        error_snippet=summarize_error(root_cause or ""),
+                        screenshot_path=screenshot_path,
+                        failure_entries=failure_entries,
                     )
-            write_report(self.root_dir, report_records)
-            if errors:
-                raise errors[0]
+                    results.append((index, record, error))
         finally:
             api_client.stop()
             manager.stop()
+        return results
+
+    def _preload_sheets(self, workbook, testcases: List[Dict[str, str]]) -> Dict[str, List[StepRow]]:
+        # Missing names are left out so only the test cases that reference them fail.
+        names = {name for tc in testcases for name in (tc["before_hook"], tc["steps_sheet"], tc["after_hook"]) if name}
+        return {name: self._read_steps(workbook[name]) for name in names if name in workbook.sheetnames}
 
     def execute_steps_sheet(
         self,
@@ -158,37 +228,60 @@ class DslExecutor:
         steps_log: Optional[List[str]] = None,
         failure_entries: Optional[List[dict]] = None,
     ) -> None:
-        """Execute a sheet containing DSL steps."""
+        """Execute a sheet containing DSL steps; workbook may also map sheet names to parsed steps."""
+        if isinstance(workbook, dict) and sheet_name not in workbook:
+            raise ValueError(f"Worksheet {sheet_name} does not exist.")
         sheet = workbook[sheet_name]
-        steps = self._read_steps(sheet)
+        steps = sheet if isinstance(sheet, list) else self._read_steps(sheet)
+        self._execute_steps(steps, context, steps_log=steps_log, failure_entries=failure_entries)
+
+    def _execute_steps(
+        self,
+        steps: List[StepRow],
+        context: Optional[ContextStore] = None,
+        steps_log: Optional[List[str]] = None,
+        failure_entries: Optional[List[dict]] = None,
+    ) -> None:
         ctx = context or self._build_context(None, None)
+        resolver: LocatorResolver = ctx.get("locator_resolver")
+        condition_eval: ConditionEvaluator = ctx.get("condition_evaluator")
+        screenshot_func: Optional[Callable[[str], Optional[str]]] = ctx.get("screenshot_func")
 
         for step in steps:
-            self._execute_step(step, ctx, steps_log=steps_log, failure_entries=failure_entries)
+            self._execute_step(
+                step,
+                ctx,
+                resolver,
+                condition_eval,
+                screenshot_func,
+                steps_log=steps_log,
+                failure_entries=failure_entries,
+            )
 
     def _execute_step(
         self,
         step: StepRow,
         context: ContextStore,
+        resolver: LocatorResolver,
+        condition_eval: ConditionEvaluator,
+        screenshot_func: Optional[Callable[[str], Optional[str]]],
         steps_log: Optional[List[str]] = None,
         failure_entries: Optional[List[dict]] = None,
     ) -> None:
-        if step.execute and step.execute.upper() not in {"Y", "YES", "TRUE", "1"}:
+        if not step.enabled:
             return
-        command_name = step.command.upper()
-        command = self.registry.get(command_name)
+        command_name = step.command_upper
+        command = self.registry.get_upper(command_name)
 
         target = context.resolve(step.target)
         data = context.resolve(step.data)
 
-        if target and "." in target and command_name not in {"OPEN_URL", "API_CALL"}:
-            resolver: LocatorResolver = context.get("locator_resolver")
+        if step.uses_locator and target and "." in target:
             target_resolved = resolver.resolve(target)
         else:
             target_resolved = target
 
-        condition_eval = context.get("condition_evaluator")
-        condition_result = condition_eval.evaluate(step.condition, target_resolved, context)
+        condition_result = condition_eval.evaluate_parsed(step.parsed_condition, target_resolved, context)
         if not condition_result.should_execute:
             self.logger.info(
                 "DSL step skipped | command=%s target=%s resolved=%s condition=%s",
@@ -201,6 +294,9 @@ class DslExecutor:
 
         attempts = max(1, condition_result.retry_count + 1)
         last_error = None
+        descriptor = None
+        if steps_log is not None or failure_entries is not None:
+            descriptor = f"{command_name} | {target or ''} | {data or ''}"
         for attempt in range(attempts):
             try:
                 self.logger.info(
@@ -213,7 +309,7 @@ class DslExecutor:
                     step.store,
                 )
                 if steps_log is not None:
-                    steps_log.append(f"{command_name} | {target or ''} | {data or ''}")
+                    steps_log.append(descriptor)
                 result = command.execute(target_resolved, data, context)
                 if step.store:
                     context.set(step.store, result)
@@ -223,14 +319,13 @@ class DslExecutor:
                 self.logger.error("DSL step failed (attempt %s/%s): %s", attempt + 1, attempts, str(exc))
         if last_error:
             failure_category = (step.failure_category or "STOP_ON_FAILURE").upper()
-            screenshot_func = context.get("screenshot_func")
             screenshot_path = None
             if screenshot_func:
-                screenshot_path = screenshot_func(f"{safe_name(step.command)}_{safe_name(step.seq or 'step')}")
+                screenshot_path = screenshot_func(step.screenshot_stem)
             if failure_entries is not None:
                 failure_entries.append(
                     {
-                        "step": f"{command_name} | {target or ''} | {data or ''}",
+                        "step": descriptor,
                         "category": failure_category,
                         "error": str(last_error),
                         "screenshot": screenshot_path,
@@ -242,16 +337,8 @@ class DslExecutor:
             raise last_error
 
     def _register_commands(self) -> None:
-        self.registry.register(OpenUrlCommand.name, OpenUrlCommand())
-        self.registry.register(ClickCommand.name, ClickCommand())
-        self.registry.register(TypeTextCommand.name, TypeTextCommand())
-        self.registry.register(VerifyTextCommand.name, VerifyTextCommand())
-        self.registry.register(VerifyVisibleCommand.name, VerifyVisibleCommand())
-        self.registry.register(CallFlowCommand.name, CallFlowCommand())
-        self.registry.register(ApiCallCommand.name, ApiCallCommand())
-        self.registry.register(VerifyStatusCommand.name, VerifyStatusCommand())
-        self.registry.register(StoreResponseCommand.name, StoreResponseCommand())
-        self.registry.register(TakeScreenshotCommand.name, TakeScreenshotCommand())
+        for command_cls in _COMMAND_CLASSES:
+            self.registry.register(command_cls.name, command_cls())
 
     def _build_context(self, page, api_client) -> ContextStore:
         env = self.config["environment"]
@@ -273,6 +360,14 @@ class DslExecutor:
         context.set("flow_executor", lambda name, params: self._execute_flow(name, params, context))
         return context
 
+    @property
+    def _flow_depth(self) -> int:
+        return getattr(self._local, "flow_depth", 0)
+
+    @_flow_depth.setter
+    def _flow_depth(self, value: int) -> None:
+        self._local.flow_depth = value
+
     def _execute_flow(self, flow_name: str, params: Dict[str, str], context: ContextStore) -> None:
         if not flow_name:
             raise ValueError("CALL_FLOW requires a flow name.")
@@ -283,29 +378,43 @@ class DslExecutor:
             raise ValueError(f"Missing flow: {flow_name}")
         self._flow_depth += 1
         try:
-            workbook = load_workbook(flow_path)
-            sheet_name = workbook.sheetnames[0]
-            old_values = {}
-            for key, value in params.items():
-                old_values[key] = context.get(key)
-                context.set(key, value)
-            self.execute_steps_sheet(workbook, sheet_name, context=context)
-            for key, value in old_values.items():
-                context.set(key, value)
+            steps = self._load_flow_steps(flow_path)
+            old_values = context.update(params) if params else None
+            try:
+                self._execute_steps(steps, context=context)
+            finally:
+                if old_values:
+                    context.update(old_values)
         finally:
             self._flow_depth -= 1
 
+    def _load_flow_steps(self, flow_path: str) -> List[StepRow]:
+        key = (flow_path, os.path.getmtime(flow_path))
+        steps = _FLOW_CACHE.get(key)
+        if steps is not None:
+            return steps
+        workbook = load_workbook(flow_path, read_only=True, data_only=True)
+        try:
+            steps = self._read_steps(workbook[workbook.sheetnames[0]])
+        finally:
+            workbook.close()
+        with _FLOW_CACHE_LOCK:
+            if len(_FLOW_CACHE) >= _FLOW_CACHE_MAX:
+                _FLOW_CACHE.pop(next(iter(_FLOW_CACHE), None), None)
+            _FLOW_CACHE[key] = steps
+        return steps
+
     def _read_testcases(self, sheet) -> List[Dict[str, str]]:
-        headers = [str(cell.value).strip() if cell.value else "" for cell in next(sheet.iter_rows(min_row=1, max_row=1))]
-        header_index = {name: idx for idx, name in enumerate(headers)}
+        rows = sheet.iter_rows(values_only=True)
+        header_index = _header_index(next(rows, ()))
         execute_idx = _pick_header(header_index, ["Execute (Y/N)", "Execute"])
         before_idx = _pick_header(header_index, ["BeforeHook"])
         after_idx = _pick_header(header_index, ["AfterHook"])
         steps_idx = _pick_header(header_index, ["StepsSheet"])
         tc_id_idx = _pick_header(header_index, ["TestCaseID"])
         cases: List[Dict[str, str]] = []
-        for row in sheet.iter_rows(min_row=2, values_only=True):
-            if not row or all(cell is None for cell in row):
+        for row in rows:
+            if row.count(None) == len(row):
                 continue
             tc_id = _cell(row, tc_id_idx)
             execute = _cell(row, execute_idx).upper() or "N"
@@ -322,29 +431,41 @@ class DslExecutor:
         return cases
 
     def _read_steps(self, sheet) -> List[StepRow]:
-        headers = [str(cell.value).strip() if cell.value else "" for cell in next(sheet.iter_rows(min_row=1, max_row=1))]
-        header_index = {name: idx for idx, name in enumerate(headers)}
+        rows = sheet.iter_rows(values_only=True)
+        header_index = _header_index(next(rows, ()))
         execute_idx = _pick_header(header_index, ["Execute (Y/N)", "Execute"])
         failure_idx = _pick_header(header_index, ["Failure Category", "FailureCategory"])
+        seq_idx = header_index.get("Seq")
+        command_idx = header_index.get("COMMAND")
+        target_idx = header_index.get("TARGET")
+        data_idx = header_index.get("DATA")
+        condition_idx = header_index.get("CONDITION")
+        store_idx = header_index.get("STORE")
+        cell = _cell
         steps = []
-        for row in sheet.iter_rows(min_row=2, values_only=True):
-            if not row or all(cell is None for cell in row):
+        for row in rows:
+            if row.count(None) == len(row):
                 continue
             steps.append(
                 StepRow(
-                    seq=_cell(row, header_index.get("Seq")),
-                    execute=_cell(row, execute_idx),
-                    command=_cell(row, header_index.get("COMMAND")),
-                    target=_cell(row, header_index.get("TARGET")),
-                    data=_cell(row, header_index.get("DATA")),
-                    condition=_cell(row, header_index.get("CONDITION")),
-                    store=_cell(row, header_index.get("STORE")),
-                    failure_category=_cell(row, failure_idx),
+                    seq=cell(row, seq_idx),
+                    execute=cell(row, execute_idx),
+                    command=cell(row, command_idx),
+                    target=cell(row, target_idx),
+                    data=cell(row, data_idx),
+                    condition=cell(row, condition_idx),
+                    store=cell(row, store_idx),
+                    failure_category=cell(row, failure_idx),
                 )
             )
         return steps
 
 
+def _header_index(header_row) -> Dict[str, int]:
+    headers = [str(value).strip() if value else "" for value in header_row]
+    return {name: idx for idx, name in enumerate(headers)}
+
+
 def _cell(row, index) -> str:
     if index is None or index >= len(row):
         return ""
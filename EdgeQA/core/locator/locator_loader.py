@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 from openpyxl import load_workbook
 
@@ -18,21 +18,33 @@ def load_locator_repository(path: str) -> LocatorRepo:
     if path in _CACHE:
         return _CACHE[path]
 
-    workbook = load_workbook(path)
-    sheet = workbook.active
-    rows = list(sheet.iter_rows(values_only=True))
-    if not rows:
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        repo = _read_repository(workbook.active)
+    finally:
+        workbook.close()
+    if repo is None:
         return {}
 
-    headers = [str(cell).strip().lower() if cell is not None else "" for cell in rows[0]]
+    _CACHE[path] = repo
+    return repo
+
+
+def _read_repository(sheet) -> Optional[LocatorRepo]:
+    rows = sheet.iter_rows(values_only=True)
+    header_row = next(rows, None)
+    if header_row is None:
+        return None
+
+    headers = [str(cell).strip().lower() if cell is not None else "" for cell in header_row]
     header_index = {name: idx for idx, name in enumerate(headers)}
     required = {"page", "name", "primary", "secondary", "type"}
     if not required.issubset(set(header_index.keys())):
-        return {}
+        return None
 
     repo: LocatorRepo = {}
-    for row in rows[1:]:
-        if not row or all(cell is None for cell in row):
+    for row in rows:
+        if row.count(None) == len(row):
             continue
         page = _cell(row, header_index.get("page"))
         name = _cell(row, header_index.get("name"))
@@ -41,8 +53,6 @@ def load_locator_repository(path: str) -> LocatorRepo:
         loc_type = _cell(row, header_index.get("type"))
         if page and name and primary and loc_type:
             repo.setdefault(page, {})[name] = (primary, secondary, loc_type, page)
-
-    _CACHE[path] = repo
     return repo
 
 
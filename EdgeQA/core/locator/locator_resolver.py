@@ -2,48 +2,61 @@
 
 from __future__ import annotations
 
-from typing import Dict, Tuple
+import functools
+from typing import Dict
 
 from core.locator.locator_loader import LocatorRepo
 
+_SELECTOR_PREFIXES = ("css=", "xpath=", "text=", "id=")
+_TYPE_PREFIXES = {
+    "css": "css=",
+    "xpath": "xpath=",
+    "text": "text=",
+    "id": "id=",
+    "button": "css=",
+}
+
 
 class LocatorResolver:
     """Resolve semantic locators with primary/secondary fallback."""
 
     def __init__(self, repository: LocatorRepo) -> None:
         self.repository = repository
+        self._resolved: Dict[str, str] = _build_resolved(repository)
 
     def resolve(self, target: str) -> str:
         """Resolve a locator in Page.Name format."""
+        selector = self._resolved.get(target)
+        if selector is not None:
+            return selector
         if "." not in target or target.count(".") != 1:
             raise ValueError("Invalid locator format. Expected PageName.LocatorName")
-        page, name = target.split(".", 1)
-        if page not in self.repository:
-            raise ValueError(f"LocatorNotFoundException: {target}")
-        if name not in self.repository[page]:
-            raise ValueError(f"LocatorNotFoundException: {target}")
-        primary, secondary, loc_type, _page = self.repository[page][name]
-        selector = _to_selector(loc_type, primary)
-        if selector:
-            return selector
-        if secondary:
-            return _to_selector(loc_type, secondary)
         raise ValueError(f"LocatorNotFoundException: {target}")
 
 
+def _build_resolved(repository: LocatorRepo) -> Dict[str, str]:
+    resolved: Dict[str, str] = {}
+    for page, locators in repository.items():
+        if "." in page:
+            continue
+        for name, (primary, secondary, loc_type, _page) in locators.items():
+            if "." in name:
+                continue
+            selector = _to_selector(loc_type, primary)
+            if not selector and secondary:
+                selector = _to_selector(loc_type, secondary)
+            if selector:
+                resolved[f"{page}.{name}"] = selector
+    return resolved
+
+
+@functools.lru_cache(maxsize=512)
 def _to_selector(loc_type: str, value: str) -> str:
     loc_type = loc_type.strip().lower()
     value = value.strip()
-    if value.startswith(("css=", "xpath=", "text=", "id=")):
+    if value.startswith(_SELECTOR_PREFIXES):
         return value
-    mapping = {
-        "css": "css=",
-        "xpath": "xpath=",
-        "text": "text=",
-        "id": "id=",
-        "button": "css=",
-    }
-    prefix = mapping.get(loc_type)
+    prefix = _TYPE_PREFIXES.get(loc_type)
     if not prefix:
         return ""
     return f"{prefix}{value}"
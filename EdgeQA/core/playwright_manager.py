@@ -29,28 +29,40 @@ class PlaywrightManager:
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self._screenshots_dir: Optional[str] = None
+        self._owns_browser = True
 
-    def start(self) -> Page:
-        """Start Playwright and create a new page."""
-        self.playwright = sync_playwright().start()
-        browser_launcher = getattr(self.playwright, self.browser_name)
-        self.browser = browser_launcher.launch(
+    def launch_browser(self, playwright: Playwright) -> Browser:
+        """Launch the configured browser on the given Playwright driver."""
+        browser_launcher = getattr(playwright, self.browser_name)
+        return browser_launcher.launch(
             headless=bool(self.browser_config.get("headless", True)),
             slow_mo=int(self.browser_config.get("slow_mo", 0)),
         )
 
+    def start(self, browser: Optional[Browser] = None) -> Page:
+        """Start Playwright and create a new page, reusing browser when one is given."""
+        self._owns_browser = browser is None
+        if browser is None:
+            self.playwright = sync_playwright().start()
+            browser = self.launch_browser(self.playwright)
+        self.browser = browser
+
         context_kwargs = {}
         if self.record_video:
             video_dir = ensure_dir(os.path.join(self.artifacts_dir, VIDEO_DIR_NAME))
             context_kwargs["record_video_dir"] = video_dir
         self.context = self.browser.new_context(**context_kwargs)
         self.page = self.context.new_page()
+        self._screenshots_dir = ensure_dir(os.path.join(self.artifacts_dir, SCREENSHOTS_DIR_NAME))
         return self.page
 
     def stop(self) -> None:
         """Stop Playwright and close resources."""
         if self.context:
             self.context.close()
+        if not self._owns_browser:
+            return
         if self.browser:
             self.browser.close()
         if self.playwright:
@@ -60,8 +72,7 @@ class PlaywrightManager:
         """Capture a screenshot and return its path."""
         if not self.page:
             return None
-        screenshots_dir = ensure_dir(os.path.join(self.artifacts_dir, SCREENSHOTS_DIR_NAME))
         filename = f"{test_name}.png".replace(" ", "_")
-        path = os.path.join(screenshots_dir, filename)
+        path = os.path.join(self._screenshots_dir, filename)
         self.page.screenshot(path=path, full_page=full_page)
         return path
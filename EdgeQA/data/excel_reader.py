@@ -2,50 +2,132 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+import functools
+import os
+import re
+import zipfile
+from datetime import date, datetime, time
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 from openpyxl import load_workbook
 
+from data.records import StepRecord, TestCaseRecord
 
-@dataclass
-class StepRecord:
-    """Represents a single codeless step from Excel."""
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
 
-    step: str
-    action: str
-    locator: Optional[str]
-    value: Optional[str]
-    expected: Optional[str]
+_ACTIVE_TAB_PATTERN = re.compile(rb'<workbookView[^>]*\bactiveTab="(\d+)"')
 
+_EXECUTE_VALUES = frozenset({"yes", "y", "true", "1", "on", "enabled"})
+_INT_FLOAT_LIMIT = 1e16
 
-@dataclass
-class TestCaseRecord:
-    """Represents a codeless test case entry."""
+SheetRows = Tuple[Tuple[object, ...], ...]
+WorkbookRows = Tuple[str, Dict[str, SheetRows]]
 
-    test_case_id: str
-    description: Optional[str]
-    execute: bool
+
+class WorkbookReader:
+    """Read sheet values with python-calamine when installed, else openpyxl."""
+
+    def __init__(self, path: str) -> None:
+        if CalamineWorkbook is not None:
+            self._workbook = CalamineWorkbook.from_path(path)
+            self.sheetnames: List[str] = list(self._workbook.sheet_names)
+            index = _active_sheet_index(path)
+            self.active_sheet = self.sheetnames[index if index < len(self.sheetnames) else 0]
+        else:
+            self._workbook = load_workbook(path, read_only=True, data_only=True)
+            self.sheetnames = list(self._workbook.sheetnames)
+            self.active_sheet = self._workbook.active.title
+
+    def __enter__(self) -> "WorkbookReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def iter_rows(self, sheet_name: Optional[str] = None) -> Iterator[Sequence[object]]:
+        """Yield value rows for a sheet, defaulting to the active/first sheet."""
+        sheet_name = sheet_name or self.active_sheet
+        if CalamineWorkbook is None:
+            return self._workbook[sheet_name].iter_rows(values_only=True)
+        if sheet_name not in self.sheetnames:
+            raise KeyError(f"Worksheet {sheet_name} does not exist.")
+        # skip_empty_area=False anchors rows at A1 so column indices match openpyxl.
+        rows = self._workbook.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+        return ([_calamine_value(cell) for cell in row] for row in rows)
+
+    def close(self) -> None:
+        if CalamineWorkbook is None:
+            self._workbook.close()
+
+
+def load_workbook_rows(path: str) -> WorkbookRows:
+    """Return (active sheet, rows per sheet), parsed once per file modification."""
+    stat = os.stat(path)
+    return _read_workbook(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_workbook(path: str, mtime_ns: int, size: int) -> WorkbookRows:
+    with WorkbookReader(path) as workbook:
+        sheets = {name: tuple(tuple(row) for row in workbook.iter_rows(name)) for name in workbook.sheetnames}
+        return workbook.active_sheet, sheets
+
+
+def load_all_from_excel(
+    path: str,
+    sheet_name: Optional[str] = None,
+) -> Tuple[Dict[str, List[StepRecord]], Dict[str, List[StepRecord]], List[TestCaseRecord]]:
+    """Load steps, flows and test cases from a single parse of the workbook.
+
+    Steps are keyed by sheet: the requested sheet, else every enabled test case sheet, else the active sheet.
+    """
+    active_sheet, sheets = load_workbook_rows(path)
+    flows = _read_flow_sheet(iter(sheets["FLOWS"])) if "FLOWS" in sheets else {}
+    testcases = _read_testcase_sheet(iter(sheets["TestCases"])) if "TestCases" in sheets else []
+    if sheet_name:
+        names = [sheet_name]
+    elif testcases:
+        names = [case.test_case_id for case in testcases if case.execute]
+    else:
+        names = [active_sheet]
+    steps = {name: _read_step_sheet(iter(sheets[name])) for name in names}
+    return steps, flows, testcases
 
 
 def load_steps_from_excel(path: str, sheet_name: Optional[str] = None) -> List[StepRecord]:
     """Load steps from an Excel sheet."""
-    workbook = load_workbook(path)
-    sheet = workbook[sheet_name] if sheet_name else workbook.active
+    active_sheet, sheets = load_workbook_rows(path)
+    return _read_step_sheet(iter(sheets[sheet_name or active_sheet]))
+
+
+def _read_step_sheet(rows: Iterator[Sequence[object]]) -> List[StepRecord]:
     steps: List[StepRecord] = []
-    headers = [cell.value for cell in next(sheet.iter_rows(min_row=1, max_row=1))]
+    headers = next(rows, None)
+    if headers is None:
+        return steps
     header_index = _header_index(headers)
+    step_idx = header_index.get("step", 0)
+    action_idx = header_index.get("action", 1)
+    locator_idx = header_index.get("locator", 2)
+    value_idx = header_index.get("value", 3)
+    expected_idx = header_index.get("expected", 4)
+    cell = _get_cell
+    optional = _to_optional
 
-    for row in sheet.iter_rows(min_row=2, values_only=True):
-        if all(cell is None for cell in row):
+    for row in rows:
+        if row.count(None) == len(row):
             continue
         steps.append(
             StepRecord(
-                step=str(_get_cell(row, header_index.get("step", 0)) or "").strip(),
-                action=str(_get_cell(row, header_index.get("action", 1)) or "").strip(),
-                locator=_to_optional(_get_cell(row, header_index.get("locator", 2))),
-                value=_to_optional(_get_cell(row, header_index.get("value", 3))),
-                expected=_to_optional(_get_cell(row, header_index.get("expected", 4))),
+                step=str(cell(row, step_idx) or "").strip(),
+                action=str(cell(row, action_idx) or "").strip(),
+                locator=optional(cell(row, locator_idx)),
+                value=optional(cell(row, value_idx)),
+                expected=optional(cell(row, expected_idx)),
             )
         )
     return steps
@@ -53,26 +135,39 @@ def load_steps_from_excel(path: str, sheet_name: Optional[str] = None) -> List[S
 
 def load_flows_from_excel(path: str) -> Dict[str, List[StepRecord]]:
     """Load reusable flows from the FLOWS sheet."""
-    workbook = load_workbook(path)
-    if "FLOWS" not in workbook.sheetnames:
+    _, sheets = load_workbook_rows(path)
+    if "FLOWS" not in sheets:
         return {}
-    sheet = workbook["FLOWS"]
-    headers = [cell.value for cell in next(sheet.iter_rows(min_row=1, max_row=1))]
-    header_index = _header_index(headers)
+    return _read_flow_sheet(iter(sheets["FLOWS"]))
+
 
+def _read_flow_sheet(rows: Iterator[Sequence[object]]) -> Dict[str, List[StepRecord]]:
     flows: Dict[str, List[StepRecord]] = {}
-    for row in sheet.iter_rows(min_row=2, values_only=True):
-        if all(cell is None for cell in row):
+    headers = next(rows, None)
+    if headers is None:
+        return flows
+    header_index = _header_index(headers)
+    flow_idx = header_index.get("flowname", 0)
+    step_idx = header_index.get("step", 1)
+    action_idx = header_index.get("action", 2)
+    locator_idx = header_index.get("locator", 3)
+    value_idx = header_index.get("value", 4)
+    expected_idx = header_index.get("expected", 5)
+    cell = _get_cell
+    optional = _to_optional
+
+    for row in rows:
+        if row.count(None) == len(row):
             continue
-        flow_name = str(_get_cell(row, header_index.get("flowname", 0)) or "").strip()
+        flow_name = str(cell(row, flow_idx) or "").strip()
         if not flow_name:
             continue
         record = StepRecord(
-            step=str(_get_cell(row, header_index.get("step", 1)) or "").strip(),
-            action=str(_get_cell(row, header_index.get("action", 2)) or "").strip(),
-            locator=_to_optional(_get_cell(row, header_index.get("locator", 3))),
-            value=_to_optional(_get_cell(row, header_index.get("value", 4))),
-            expected=_to_optional(_get_cell(row, header_index.get("expected", 5))),
+            step=str(cell(row, step_idx) or "").strip(),
+            action=str(cell(row, action_idx) or "").strip(),
+            locator=optional(cell(row, locator_idx)),
+            value=optional(cell(row, value_idx)),
+            expected=optional(cell(row, expected_idx)),
         )
         flows.setdefault(flow_name, []).append(record)
 
@@ -83,31 +178,61 @@ def load_flows_from_excel(path: str) -> Dict[str, List[StepRecord]]:
 
 def load_testcases_from_excel(path: str) -> List[TestCaseRecord]:
     """Load test case list from the TestCases sheet."""
-    workbook = load_workbook(path)
-    if "TestCases" not in workbook.sheetnames:
+    _, sheets = load_workbook_rows(path)
+    if "TestCases" not in sheets:
         return []
-    sheet = workbook["TestCases"]
-    headers = [cell.value for cell in next(sheet.iter_rows(min_row=1, max_row=1))]
-    header_index = _header_index(headers)
+    return _read_testcase_sheet(iter(sheets["TestCases"]))
+
 
+def _read_testcase_sheet(rows: Iterator[Sequence[object]]) -> List[TestCaseRecord]:
     testcases: List[TestCaseRecord] = []
-    for row in sheet.iter_rows(min_row=2, values_only=True):
-        if all(cell is None for cell in row):
+    headers = next(rows, None)
+    if headers is None:
+        return testcases
+    header_index = _header_index(headers)
+    id_idx = header_index.get("testcaseid", 0)
+    description_idx = header_index.get("description", 1)
+    execute_idx = header_index.get("execute", 2)
+    cell = _get_cell
+
+    for row in rows:
+        if row.count(None) == len(row):
             continue
-        test_case_id = str(_get_cell(row, header_index.get("testcaseid", 0)) or "").strip()
-        description = _to_optional(_get_cell(row, header_index.get("description", 1)))
-        execute_raw = str(_get_cell(row, header_index.get("execute", 2)) or "").strip().lower()
-        execute = execute_raw in {"yes", "y", "true", "1"}
+        test_case_id = str(cell(row, id_idx) or "").strip()
+        description = _to_optional(cell(row, description_idx))
+        execute_raw = cell(row, execute_idx)
+        execute = execute_raw is not None and str(execute_raw).strip().lower() in _EXECUTE_VALUES
         if test_case_id:
             testcases.append(TestCaseRecord(test_case_id=test_case_id, description=description, execute=execute))
     return testcases
 
 
+def _active_sheet_index(path: str) -> int:
+    try:
+        with zipfile.ZipFile(path) as archive:
+            match = _ACTIVE_TAB_PATTERN.search(archive.read("xl/workbook.xml"))
+    except (KeyError, OSError, zipfile.BadZipFile):
+        return 0
+    return int(match.group(1)) if match else 0
+
+
+def _calamine_value(value):
+    # Mirror openpyxl: empty cells are None, whole numbers Excel stores without an
+    # exponent are ints, and date-only cells are midnight datetimes.
+    if value == "":
+        return None
+    if isinstance(value, float) and value.is_integer() and abs(value) < _INT_FLOAT_LIMIT:
+        return int(value)
+    if type(value) is date:
+        return datetime.combine(value, time())
+    return value
+
+
 def _to_optional(value) -> Optional[str]:
     if value is None:
         return None
-    text = str(value).strip()
-    return text if text else None
+    text = value.strip() if isinstance(value, str) else str(value).strip()
+    return text or None
 
 
 def _header_index(headers: List[object]) -> Dict[str, int]:
@@ -140,7 +265,11 @@ def _get_cell(row, index: Optional[int]):
 
 
 def _sort_steps(records: List[StepRecord]) -> List[StepRecord]:
-    try:
-        return sorted(records, key=lambda item: int(item.step))
-    except (ValueError, TypeError):
-        return records
+    keyed = []
+    for record in records:
+        try:
+            keyed.append((int(record.step), record))
+        except (ValueError, TypeError):
+            return records
+    keyed.sort(key=itemgetter(0))
+    return [record for _, record in keyed]
@@ -3,43 +3,47 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
-from typing import List, Optional
+import os
+from typing import Any, Dict, List, Optional
 
+from data.records import StepRecord
 
-@dataclass
-class StepRecord:
-    """Represents a single codeless step from JSON."""
+try:
+    import orjson
 
-    step: str
-    action: str
-    locator: Optional[str]
-    value: Optional[str]
-    expected: Optional[str]
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_STREAM_THRESHOLD_BYTES = 1_000_000
 
 
 def load_steps_from_json(path: str) -> List[StepRecord]:
-    """Load steps from a JSON file."""
-    with open(path, "r", encoding="utf-8") as handle:
-        payload = json.load(handle)
-
-    steps_data = payload.get("steps", [])
-    steps: List[StepRecord] = []
-    for item in steps_data:
-        steps.append(
-            StepRecord(
-                step=str(item.get("step", "")).strip(),
-                action=str(item.get("action", "")).strip(),
-                locator=_to_optional(item.get("locator")),
-                value=_to_optional(item.get("value")),
-                expected=_to_optional(item.get("expected")),
-            )
-        )
-    return steps
+    """Load steps from a JSON file, streaming large files when ijson is installed."""
+    with open(path, "rb") as handle:
+        if ijson is not None and os.path.getsize(path) > _STREAM_THRESHOLD_BYTES:
+            return [_to_record(item) for item in ijson.items(handle, "steps.item", use_float=True)]
+        payload = _json_loads(handle.read())
+    return [_to_record(item) for item in payload.get("steps", [])]
+
+
+def _to_record(item: Dict[str, Any]) -> StepRecord:
+    return StepRecord(
+        step=str(item.get("step", "")).strip(),
+        action=str(item.get("action", "")).strip(),
+        locator=_to_optional(item.get("locator")),
+        value=_to_optional(item.get("value")),
+        expected=_to_optional(item.get("expected")),
+    )
 
 
 def _to_optional(value) -> Optional[str]:
     if value is None:
         return None
-    text = str(value).strip()
-    return text if text else None
+    text = value.strip() if isinstance(value, str) else str(value).strip()
+    return text or None
@@ -2,54 +2,65 @@
 
 from __future__ import annotations
 
+import functools
 import os
-from typing import Dict, Tuple
+import sys
+from types import MappingProxyType
+from typing import Dict, Iterator, Mapping, Sequence, Tuple
 
-from openpyxl import load_workbook
+from data.excel_reader import load_workbook_rows
 
-LocatorRepo = Dict[str, Dict[str, Tuple[str, str]]]
-_CACHE: Dict[str, LocatorRepo] = {}
+LocatorRepo = Mapping[str, Mapping[str, Tuple[str, str]]]
 
 
 def load_object_repository(path: str) -> LocatorRepo:
-    """Load ObjectRepository.xlsx and cache the results."""
-    if not os.path.exists(path):
+    """Load ObjectRepository.xlsx and cache the results until the file changes."""
+    try:
+        stat = os.stat(path)
+    except OSError:
         return {}
-    if path in _CACHE:
-        return _CACHE[path]
-
-    workbook = load_workbook(path)
-    repository: LocatorRepo = {}
-    for sheet_name in workbook.sheetnames:
-        sheet = workbook[sheet_name]
-        rows = list(sheet.iter_rows(values_only=True))
-        if not rows:
-            continue
-        headers = [str(cell).strip().lower() if cell is not None else "" for cell in rows[0]]
-        header_index = {name: idx for idx, name in enumerate(headers)}
-        if not {"locatorname", "locatortype", "locatorvalue"}.issubset(set(header_index.keys())):
-            continue
+    return _load_object_repository_cached(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
 
-        page_locators: Dict[str, Tuple[str, str]] = {}
-        for row in rows[1:]:
-            if not row or all(cell is None for cell in row):
-                continue
-            name = _to_text(_get_cell(row, header_index.get("locatorname")))
-            locator_type = _to_text(_get_cell(row, header_index.get("locatortype")))
-            locator_value = _to_text(_get_cell(row, header_index.get("locatorvalue")))
-            if name and locator_type and locator_value:
-                page_locators[name] = (locator_type, locator_value)
+
+@functools.lru_cache(maxsize=8)
+def _load_object_repository_cached(path: str, mtime_ns: int, size: int) -> LocatorRepo:
+    repository: Dict[str, Mapping[str, Tuple[str, str]]] = {}
+    _, sheets = load_workbook_rows(path)
+    for sheet_name, rows in sheets.items():
+        page_locators = _read_locator_sheet(iter(rows))
         if page_locators:
-            repository[sheet_name] = page_locators
+            repository[sheet_name] = MappingProxyType(page_locators)
+    return MappingProxyType(repository)
+
 
-    _CACHE[path] = repository
-    return repository
+def _read_locator_sheet(rows: Iterator[Sequence[object]]) -> Dict[str, Tuple[str, str]]:
+    header_row = next(rows, None)
+    if not header_row:
+        return {}
+    headers = [str(cell).strip().lower() if cell is not None else "" for cell in header_row]
+    header_index = {name: idx for idx, name in enumerate(headers)}
+    if not {"locatorname", "locatortype", "locatorvalue"}.issubset(header_index.keys()):
+        return {}
+
+    name_idx = header_index["locatorname"]
+    type_idx = header_index["locatortype"]
+    value_idx = header_index["locatorvalue"]
+    page_locators: Dict[str, Tuple[str, str]] = {}
+    for row in rows:
+        if row.count(None) == len(row):
+            continue
+        name = _to_text(_get_cell(row, name_idx))
+        locator_type = _to_text(_get_cell(row, type_idx))
+        locator_value = _to_text(_get_cell(row, value_idx))
+        if name and locator_type and locator_value:
+            page_locators[sys.intern(name)] = (sys.intern(locator_type), locator_value)
+    return page_locators
 
 
 def _to_text(value) -> str:
     if value is None:
         return ""
-    return str(value).strip()
+    return value.strip() if isinstance(value, str) else str(value).strip()
 
 
 def _get_cell(row, index):
@@ -0,0 +1,26 @@
+"""Shared step and test case records for codeless data readers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True, frozen=True)
+class StepRecord:
+    """Represents a single codeless step from Excel or JSON."""
+
+    step: str
+    action: str
+    locator: Optional[str]
+    value: Optional[str]
+    expected: Optional[str]
+
+
+@dataclass(slots=True, frozen=True)
+class TestCaseRecord:
+    """Represents a codeless test case entry."""
+
+    test_case_id: str
+    description: Optional[str]
+    execute: bool
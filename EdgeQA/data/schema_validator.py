@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from jsonschema import validate
+from jsonschema import Draft202012Validator
 
 
 EXCEL_SCHEMA = {
@@ -36,7 +36,10 @@ JSON_SCHEMA = {
     "required": ["steps"],
 }
 
+Draft202012Validator.check_schema(JSON_SCHEMA)
+_JSON_VALIDATOR = Draft202012Validator(JSON_SCHEMA)
+
 
 def validate_json_schema(payload: Dict[str, Any]) -> None:
     """Validate JSON payload with the predefined schema."""
-    validate(instance=payload, schema=JSON_SCHEMA)
+    _JSON_VALIDATOR.validate(payload)
@@ -5,6 +5,13 @@ from __future__ import annotations
 import json
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from core.api_client import ApiClient
 from utils.assertion_utils import assert_equal
 
@@ -59,6 +66,4 @@ class APIKeywords:
 
 
 def _parse_json(content: bytes) -> Dict[str, Any]:
-    if not content:
-        return {}
-    return json.loads(content.decode("utf-8"))
+    return _json_loads(content) if content else {}
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
 import os
-import time
+import re
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional, Pattern, Tuple, Union
 
-from playwright.sync_api import Page
+from playwright.sync_api import Locator, Page, expect
 
 from core.constants import SCREENSHOTS_DIR_NAME
 from utils.assertion_utils import assert_equal, assert_true
 from utils.file_utils import ensure_dir
 from utils.wait_utils import is_visible, wait_for_selector
 
+_SESSION_TS = datetime.now().strftime("%Y%m%d_%H%M%S")
+_COUNTER = itertools.count()
+_REGEX_PREFIX = "regex="
+_LOCATOR_CACHE_MAX = 256
+
 
 class UIKeywords:
     """UI keyword library for codeless execution."""
@@ -31,6 +38,8 @@ class UIKeywords:
         self.manager = manager
         self._pages = [page]
         self._frame = None
+        self._screenshots_dir: Optional[str] = None
+        self._locator_cache: Dict[Tuple[object, str], Locator] = {}
 
     def open_url(self, url: str) -> None:
         """Open the specified URL."""
@@ -38,48 +47,39 @@ class UIKeywords:
 
     def click(self, locator: str) -> None:
         """Click on an element."""
-        self._wait_for(locator)
         self._locator(locator).click(timeout=self.timeout_ms)
 
     def double_click(self, locator: str) -> None:
         """Double-click on an element."""
-        self._wait_for(locator)
         self._locator(locator).dblclick(timeout=self.timeout_ms)
 
     def right_click(self, locator: str) -> None:
         """Right-click on an element."""
-        self._wait_for(locator)
         self._locator(locator).click(button="right", timeout=self.timeout_ms)
 
     def fill_text(self, locator: str, value: str) -> None:
         """Fill text into an input element."""
-        self._wait_for(locator)
         self._locator(locator).fill(value, timeout=self.timeout_ms)
 
     def clear_text(self, locator: str) -> None:
         """Clear text from an input element."""
-        self._wait_for(locator)
         self._locator(locator).fill("", timeout=self.timeout_ms)
 
     def press_key(self, locator: str, key: str) -> None:
         """Press a key on an element."""
-        self._wait_for(locator)
         self._locator(locator).press(key, timeout=self.timeout_ms)
 
     def select_dropdown(self, locator: str, value: str) -> None:
         """Select a value in a dropdown."""
-        self._wait_for(locator)
-        self._locator(locator).select_option(value=value)
+        self._locator(locator).select_option(value=value, timeout=self.timeout_ms)
 
     def hover(self, locator: str) -> None:
         """Hover over an element."""
-        self._wait_for(locator)
-        self._locator(locator).hover()
+        self._locator(locator).hover(timeout=self.timeout_ms)
 
     def scroll_to(self, locator: str) -> None:
         """Scroll to an element."""
-        self._wait_for(locator)
-        self._locator(locator).scroll_into_view_if_needed()
+        self._locator(locator).scroll_into_view_if_needed(timeout=self.timeout_ms)
 
     def wait_for_element(self, locator: str) -> None:
         """Wait for an element to be visible."""
@@ -115,20 +115,18 @@ class UIKeywords:
 
     def assert_text(self, locator: str, expected: str) -> None:
         """Assert element text equals expected."""
-        self._wait_for(locator)
-        actual = self._locator(locator).text_content() or ""
-        assert_equal(actual.strip(), expected.strip(), "Text assertion failed")
+        expect(self._locator(locator), "Text assertion failed").to_have_text(expected.strip(), timeout=self.timeout_ms)
 
     def assert_contains_text(self, locator: str, expected: str) -> None:
         """Assert element text contains expected."""
-        self._wait_for(locator)
-        actual = self._locator(locator).text_content() or ""
-        assert_true(expected.strip() in actual.strip(), "Text containment assertion failed")
+        expect(self._locator(locator), "Text containment assertion failed").to_contain_text(
+            expected.strip(), timeout=self.timeout_ms
+        )
 
     def assert_visible(self, locator: str) -> None:
         """Assert element visibility."""
         visible = is_visible(self.page, locator, self.timeout_ms)
-        assert_true(visible, f"Element not visible: {locator}")
+        assert_true(visible, lambda: f"Element not visible: {locator}")
 
     def assert_title(self, expected: str) -> None:
         """Assert page title equals expected."""
@@ -143,9 +141,8 @@ class UIKeywords:
 
     def screenshot_element(self, locator: str, filename: Optional[str] = None) -> str:
         """Capture a screenshot of a specific element."""
-        self._wait_for(locator)
         path = self._screenshot_path(filename)
-        self._locator(locator).screenshot(path=path)
+        self._locator(locator).screenshot(path=path, timeout=self.timeout_ms)
         return path
 
     def browser_back(self) -> None:
@@ -157,10 +154,10 @@ class UIKeywords:
         self.page.reload(timeout=self.timeout_ms)
 
     def wait_for_url(self, url_or_pattern: str) -> None:
-        """Wait for the page URL to match."""
+        """Wait for the page URL to match a URL, glob, or regex= pattern."""
         if not url_or_pattern:
             raise ValueError("wait_for_url requires a URL or pattern.")
-        self.page.wait_for_url(url_or_pattern, timeout=self.timeout_ms)
+        self.page.wait_for_url(_compile_url_pattern(url_or_pattern), timeout=self.timeout_ms)
 
     def wait_for_load_state(self, state: str = "load") -> None:
         """Wait for the given page load state."""
@@ -207,10 +204,12 @@ class UIKeywords:
         """Switch to a frame by locator."""
         wait_for_selector(self.page, frame_locator, self.timeout_ms)
         self._frame = self.page.frame_locator(frame_locator)
+        self._locator_cache.clear()
 
     def switch_to_main_frame(self) -> None:
         """Return to the main frame."""
         self._frame = None
+        self._locator_cache.clear()
 
     def maximize_window(self) -> None:
         """Maximize browser window when supported."""
@@ -218,6 +217,7 @@ class UIKeywords:
 
     def _set_page(self, page: Page) -> None:
         self.page = page
+        self._locator_cache.clear()
         if self.manager:
             self.manager.page = page
 
@@ -227,31 +227,37 @@ class UIKeywords:
         else:
             wait_for_selector(self.page, locator, self.timeout_ms)
 
-    def _locator(self, locator: str):
-        if self._frame:
-            return self._frame.locator(locator)
-        return self.page.locator(locator)
+    def _locator(self, locator: str) -> Locator:
+        scope = self._frame or self.page
+        key = (scope, locator)
+        cached = self._locator_cache.get(key)
+        if cached is None:
+            if len(self._locator_cache) >= _LOCATOR_CACHE_MAX:
+                self._locator_cache.clear()
+            cached = self._locator_cache[key] = scope.locator(locator)
+        return cached
 
     def _screenshot_path(self, filename: Optional[str]) -> str:
-        base_dir = self.artifacts_dir or os.getcwd()
-        screenshots_dir = ensure_dir(os.path.join(base_dir, SCREENSHOTS_DIR_NAME))
-        name = filename or f"screenshot_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.png"
+        if self._screenshots_dir is None:
+            base_dir = self.artifacts_dir or os.getcwd()
+            self._screenshots_dir = ensure_dir(os.path.join(base_dir, SCREENSHOTS_DIR_NAME))
+        name = filename or f"screenshot_{_SESSION_TS}_{os.getpid()}_{next(_COUNTER)}.png"
         if not name.lower().endswith(".png"):
             name += ".png"
         if os.path.isabs(name):
             return name
-        return os.path.join(screenshots_dir, name)
+        return os.path.join(self._screenshots_dir, name)
 
     def _wait_for_enabled_state(self, locator: str, should_be_enabled: bool) -> None:
-        self._locator(locator).wait_for(state="visible", timeout=self.timeout_ms)
-        end_time = time.monotonic() + (self.timeout_ms / 1000)
-        while time.monotonic() < end_time:
-            try:
-                is_enabled = self._locator(locator).is_enabled()
-            except Exception:  # noqa: BLE001
-                is_enabled = False
-            if is_enabled == should_be_enabled:
-                return
-            time.sleep(0.1)
-        state_label = "enabled" if should_be_enabled else "disabled"
-        raise TimeoutError(f"Timed out waiting for element to be {state_label}: {locator}")
+        try:
+            expect(self._locator(locator)).to_be_enabled(enabled=should_be_enabled, timeout=self.timeout_ms)
+        except AssertionError as exc:
+            state_label = "enabled" if should_be_enabled else "disabled"
+            raise TimeoutError(f"Timed out waiting for element to be {state_label}: {locator}") from exc
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_url_pattern(url_or_pattern: str) -> Union[str, Pattern[str]]:
+    if url_or_pattern.startswith(_REGEX_PREFIX):
+        return re.compile(url_or_pattern[len(_REGEX_PREFIX):])
+    return url_or_pattern
@@ -5,25 +5,38 @@ from __future__ import annotations
 import argparse
 import os
 import sys
+from typing import List, Optional
 
-sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+_ROOT_DIR = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, _ROOT_DIR)
 
+from core.constants import MAX_PARALLEL_WORKERS  # noqa: E402
 from core.engine.dsl_executor import DslExecutor  # noqa: E402
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     """Run the Excel DSL engine."""
     parser = argparse.ArgumentParser(description="Run EdgeQA Excel DSL engine.")
     parser.add_argument("--testcases", required=True, help="Path to TestCases.xlsx")
     parser.add_argument("--locator-repo", default=None, help="Path to LocatorRepository.xlsx")
     parser.add_argument("--flows-dir", default=None, help="Path to flows directory")
-    args = parser.parse_args()
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Parallel test case workers (0=auto; default from config parallel.workers)",
+    )
+    args = parser.parse_args(argv)
+
+    workers = args.workers
+    if workers is not None and workers <= 0:
+        workers = min(os.cpu_count() or 1, MAX_PARALLEL_WORKERS)
 
-    root_dir = os.path.abspath(os.path.dirname(__file__))
     executor = DslExecutor(
-        root_dir=root_dir,
+        root_dir=_ROOT_DIR,
         locator_repo_path=args.locator_repo,
         flows_dir=args.flows_dir,
+        workers=workers,
     )
     executor.execute(args.testcases)
     return 0
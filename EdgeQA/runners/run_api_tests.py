@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import argparse
 import os
-import subprocess
 import sys
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import pytest
 
-from core.constants import ENV_VAR_ENV, ENV_VAR_TAGS
+_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, _ROOT_DIR)
+
+from core.constants import ENV_VAR_ENV, ENV_VAR_TAGS, ENV_VAR_XDIST_WORKERS, MAX_PARALLEL_WORKERS
 
 
 def main() -> int:
@@ -17,7 +19,14 @@ def main() -> int:
     parser = argparse.ArgumentParser(description="Run EdgeQA API tests.")
     parser.add_argument("--environment", default=None, help="Environment name")
     parser.add_argument("--tags", default="api", help="Pytest markers to include")
-    parser.add_argument("--parallel", type=int, default=0, help="Parallel workers (0=auto)")
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=int(os.getenv(ENV_VAR_XDIST_WORKERS, "0")),
+        help=f"Parallel workers (0=auto, 1=serial; default from {ENV_VAR_XDIST_WORKERS})",
+    )
+    parser.add_argument("--fast", action="store_true", help="Run last-failed tests first and balance with worksteal")
+    parser.add_argument("--only-failed", action="store_true", help="Re-run only the tests that failed last run")
     args = parser.parse_args()
 
     if args.environment:
@@ -26,11 +35,17 @@ def main() -> int:
         os.environ[ENV_VAR_TAGS] = args.tags
 
     pytest_args = ["-m", args.tags, "tests/api"]
+    if args.only_failed:
+        pytest_args.append("--lf")
+    if args.fast:
+        pytest_args.append("--ff")
     if args.parallel is not None and (args.parallel == 0 or args.parallel > 1):
         workers = "auto" if args.parallel == 0 else str(args.parallel)
-        pytest_args.extend(["-n", workers])
+        dist = "worksteal" if args.fast else "loadfile"
+        pytest_args.extend(["-n", workers, "--maxprocesses", str(MAX_PARALLEL_WORKERS), "--dist", dist])
 
-    return subprocess.call([sys.executable, "-m", "pytest", *pytest_args])
+    os.chdir(_ROOT_DIR)
+    return int(pytest.main(pytest_args))
 
 
 if __name__ == "__main__":
@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import argparse
 import os
-import subprocess
 import sys
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import runner
 from core.constants import ENV_VAR_BROWSER, ENV_VAR_ENV
 
 
@@ -17,15 +17,22 @@ def main() -> int:
     parser.add_argument("--testcases", required=True, help="Path to TestCases.xlsx")
     parser.add_argument("--environment", default=None, help="Environment name")
     parser.add_argument("--browser", default=None, help="Browser name")
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=None,
+        help="Parallel test case workers (0=auto, 1=serial; default from config parallel.workers)",
+    )
     args = parser.parse_args()
 
     if args.environment:
         os.environ[ENV_VAR_ENV] = args.environment
     if args.browser:
         os.environ[ENV_VAR_BROWSER] = args.browser
-    root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    runner_path = os.path.join(root_dir, "runner.py")
-    return subprocess.call([sys.executable, runner_path, "--testcases", args.testcases])
+    runner_args = ["--testcases", args.testcases]
+    if args.parallel is not None:
+        runner_args.extend(["--workers", str(args.parallel)])
+    return runner.main(runner_args)
 
 
 if __name__ == "__main__":
@@ -2,22 +2,21 @@
 
 from __future__ import annotations
 
-import os
-
 import pytest
 
 from core.api_client import ApiClient
-from utils.config_loader import load_config
 
 
 @pytest.mark.api
-def test_get_post():
+def test_get_post(framework_config, playwright_session):
     """Validate GET /posts/1 returns 200."""
-    root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-    config = load_config(root_dir)
-    base_url = config["environment"].get("api_base_url", "https://jsonplaceholder.typicode.com")
+    base_url = framework_config["environment"].get("api_base_url", "https://jsonplaceholder.typicode.com")
 
-    client = ApiClient(base_url=base_url, timeout_ms=config["config"]["timeouts"]["api"])
+    client = ApiClient(
+        base_url=base_url,
+        timeout_ms=framework_config["config"]["timeouts"]["api"],
+        playwright=playwright_session,
+    )
     client.start()
     try:
         response = client.get("/posts/1")
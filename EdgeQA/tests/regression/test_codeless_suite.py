@@ -11,6 +11,8 @@ from core.constants import ENV_VAR_CODELESS_SUITE
 
 pytest.skip("Legacy codeless engine is deprecated. Use DSL runner.", allow_module_level=True)
 
+_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
 
 @pytest.mark.codeless
 @pytest.mark.regression
@@ -19,6 +21,5 @@ def test_codeless_suite():
     suite_path = os.getenv(ENV_VAR_CODELESS_SUITE)
     if not suite_path:
         pytest.skip(f"{ENV_VAR_CODELESS_SUITE} not set")
-    root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-    executor = CodelessExecutor(root_dir)
+    executor = CodelessExecutor(_ROOT_DIR)
     executor.execute_suite(suite_path)
@@ -0,0 +1,138 @@
+"""Unit tests for DSL condition parsing and evaluation."""
+
+from __future__ import annotations
+
+import re
+from typing import Optional, Tuple
+
+import pytest
+
+from core.conditions import condition_evaluator
+from core.conditions.condition_evaluator import (
+    NO_CONDITION,
+    ConditionEvaluator,
+    ConditionKind,
+    ParsedCondition,
+    parse_condition,
+)
+from core.engine.context_store import ContextStore
+
+_LEGACY_RETRY = re.compile(r"RETRY\((\d+)\)", re.IGNORECASE)
+
+
+class FakeLocator:
+    def __init__(self, exists: bool) -> None:
+        self._exists = exists
+
+    def count(self) -> int:
+        return 1 if self._exists else 0
+
+
+class FakePage:
+    def __init__(self, exists: bool) -> None:
+        self._exists = exists
+
+    def locator(self, _selector: str):
+        return FakeLocator(self._exists)
+
+
+def _legacy_parse(condition: Optional[str]) -> Tuple[ConditionKind, int]:
+    """Mirror the original string-matching evaluator."""
+    if not condition:
+        return ConditionKind.NONE, 0
+    normalized = condition.strip().upper()
+    retry_match = _LEGACY_RETRY.search(normalized)
+    retry_count = int(retry_match.group(1)) if retry_match else 0
+    for kind in (ConditionKind.IF_EXISTS, ConditionKind.IF_NOT_EXISTS, ConditionKind.WAIT_UNTIL):
+        if normalized.startswith(kind.name):
+            return kind, retry_count
+    return ConditionKind.NONE, retry_count
+
+
+_CASES = [
+    (None, ConditionKind.NONE, 0),
+    ("", ConditionKind.NONE, 0),
+    ("IF_EXISTS", ConditionKind.IF_EXISTS, 0),
+    ("  if_exists  ", ConditionKind.IF_EXISTS, 0),
+    ("IF_NOT_EXISTS", ConditionKind.IF_NOT_EXISTS, 0),
+    ("if_not_exists RETRY(2)", ConditionKind.IF_NOT_EXISTS, 2),
+    ("WAIT_UNTIL", ConditionKind.WAIT_UNTIL, 0),
+    ("WAIT_UNTIL|RETRY(5)", ConditionKind.WAIT_UNTIL, 5),
+    ("IF_EXISTS retry(12)", ConditionKind.IF_EXISTS, 12),
+    ("RETRY(3)", ConditionKind.NONE, 3),
+    ("UNKNOWN", ConditionKind.NONE, 0),
+    ("EXISTS_IF", ConditionKind.NONE, 0),
+    ("IF_EXISTS RETRY(", ConditionKind.IF_EXISTS, 0),
+    ("IF_EXISTS RETRY()", ConditionKind.IF_EXISTS, 0),
+    ("IF_EXISTS RETRY(3", ConditionKind.IF_EXISTS, 0),
+    ("IF_EXISTS RETRY( 3)", ConditionKind.IF_EXISTS, 0),
+    ("IF_EXISTS RETRY(-1)", ConditionKind.IF_EXISTS, 0),
+    ("IF_EXISTS RETRY(1.5)", ConditionKind.IF_EXISTS, 0),
+    ("IF_EXISTS RETRY(x) RETRY(2)", ConditionKind.IF_EXISTS, 2),
+    ("IF_EXISTS RETRY(2) RETRY(5)", ConditionKind.IF_EXISTS, 2),
+    ("IF_EXISTS RETRY(RETRY(4)", ConditionKind.IF_EXISTS, 4),
+]
+
+
+@pytest.mark.parametrize("condition,kind,retry_count", _CASES)
+def test_parse_condition(condition, kind, retry_count):
+    parsed = parse_condition(condition)
+    assert (parsed.kind, parsed.retry_count) == (kind, retry_count)
+    assert (parsed.kind, parsed.retry_count) == _legacy_parse(condition)
+
+
+def test_parse_condition_empty_is_shared_constant():
+    assert parse_condition(None) is NO_CONDITION
+    assert parse_condition("") is NO_CONDITION
+
+
+def test_parse_condition_reuses_cached_result():
+    first = parse_condition("IF_EXISTS RETRY(7)")
+    assert parse_condition("IF_EXISTS RETRY(7)") is first
+
+
+def test_parse_cache_is_bounded():
+    for index in range(condition_evaluator._PARSE_CACHE_MAX + 10):
+        parse_condition(f"IF_EXISTS RETRY({index})")
+    assert len(condition_evaluator._PARSE_CACHE) <= condition_evaluator._PARSE_CACHE_MAX
+    assert parse_condition("IF_EXISTS RETRY(3)").retry_count == 3
+
+
+@pytest.mark.parametrize(
+    "condition,exists,should_execute",
+    [
+        ("IF_EXISTS", True, True),
+        ("IF_EXISTS", False, False),
+        ("IF_NOT_EXISTS", True, False),
+        ("IF_NOT_EXISTS", False, True),
+        ("WAIT_UNTIL", True, True),
+        ("UNKNOWN", False, True),
+        (None, False, True),
+    ],
+)
+def test_evaluate_condition_kinds(condition, exists, should_execute):
+    evaluator = ConditionEvaluator(timeout_ms=100)
+    context = ContextStore({"page": FakePage(exists)})
+    result = evaluator.evaluate(condition, "css=#target", context)
+    assert result.should_execute is should_execute
+    assert result.retry_count == 0
+
+
+def test_evaluate_parsed_keeps_retry_count():
+    evaluator = ConditionEvaluator(timeout_ms=100)
+    context = ContextStore({"page": FakePage(True)})
+    result = evaluator.evaluate_parsed(ParsedCondition(ConditionKind.IF_EXISTS, 4), "css=#target", context)
+    assert (result.should_execute, result.retry_count) == (True, 4)
+
+
+def test_wait_until_times_out_when_missing():
+    evaluator = ConditionEvaluator(timeout_ms=50)
+    context = ContextStore({"page": FakePage(False)})
+    with pytest.raises(TimeoutError, match="WAIT_UNTIL timed out"):
+        evaluator.evaluate("WAIT_UNTIL", "css=#target", context)
+
+
+def test_if_exists_without_page_is_false():
+    evaluator = ConditionEvaluator(timeout_ms=100)
+    result = evaluator.evaluate("IF_EXISTS", "css=#target", ContextStore({}))
+    assert result.should_execute is False
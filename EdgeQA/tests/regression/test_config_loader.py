@@ -0,0 +1,18 @@
+"""Unit tests for the cached configuration loader."""
+
+from __future__ import annotations
+
+import os
+
+from utils.config_loader import load_config
+
+_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def test_load_config_returns_independent_copies():
+    first = load_config(_ROOT_DIR)
+    first["config"]["parallel"]["workers"] = 99
+    first["environment"].clear()
+    second = load_config(_ROOT_DIR)
+    assert second["config"]["parallel"]["workers"] == 1
+    assert second["environment"]
@@ -0,0 +1,89 @@
+"""Unit tests for ContextStore placeholder resolution."""
+
+from __future__ import annotations
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+import pytest
+
+from core.engine import context_store
+from core.engine.context_store import ContextStore
+
+_LEGACY_PATTERN = re.compile(r"\$\{([^}]+)\}")
+_DATA: Dict[str, Any] = {"a": "A", "a.b": "dotted", " a ": "spaced", "n": 5, "user_1": "u1"}
+
+
+def _legacy_resolve(text: str, data: Dict[str, Any]) -> str:
+    """Mirror the original regex-only resolver."""
+    return _LEGACY_PATTERN.sub(lambda match: str(data.get(match.group(1), "")), text)
+
+
+_CASES = [
+    ("plain text", "plain text"),
+    ("${a}", "A"),
+    ("x=${a}, n=${n}", "x=A, n=5"),
+    ("${user_1}/${a}", "u1/A"),
+    ("${missing}", ""),
+    ("pre-${missing}-post", "pre--post"),
+    ("{literal} ${a} }{", "{literal} A }{"),
+    ("{${a}}", "{A}"),
+    ("${a.b}", "dotted"),
+    ("${ a }", "spaced"),
+    ("${a} ${a.b} {x}", "A dotted {x}"),
+    ("${}", "${}"),
+    ("${a", "${a"),
+    ("$${a}", "$A"),
+]
+
+
+@pytest.mark.parametrize("text,expected", _CASES)
+def test_resolve_matches_legacy(text, expected):
+    context = ContextStore(dict(_DATA))
+    assert context.resolve(text) == expected
+    assert context.resolve(text) == _legacy_resolve(text, _DATA)
+
+
+@pytest.mark.parametrize(
+    "text,uses_format_map",
+    [("${a} {b}", True), ("${a.b}", False), ("${ a }", False), ("${a} ${a.b}", False)],
+)
+def test_template_compilation(text, uses_format_map):
+    context_store._TEMPLATE_CACHE.pop(text, None)
+    ContextStore(dict(_DATA)).resolve(text)
+    assert (context_store._TEMPLATE_CACHE[text] is not None) is uses_format_map
+
+
+def test_cached_fallback_template_is_reused():
+    context = ContextStore(dict(_DATA))
+    context.resolve("${a.b}")
+    assert "${a.b}" in context_store._TEMPLATE_CACHE
+    assert ContextStore({"a.b": "other"}).resolve("${a.b}") == "other"
+
+
+def test_set_invalidates_resolved_values():
+    context = ContextStore({"a": "1"})
+    assert context.resolve("${a}") == "1"
+    context.set("a", "2")
+    assert context.resolve("${a}") == "2"
+
+
+def test_resolve_survives_cache_clear():
+    context = ContextStore(dict(_DATA))
+    for index in range(context_store._TEMPLATE_CACHE_MAX + 5):
+        assert context.resolve(f"${{a}}-{index}") == f"A-{index}"
+    assert len(context_store._TEMPLATE_CACHE) <= context_store._TEMPLATE_CACHE_MAX
+
+
+def test_resolve_is_thread_safe_under_cache_churn(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(context_store, "_TEMPLATE_CACHE_MAX", 2)
+
+    def worker(offset: int) -> None:
+        context = ContextStore(dict(_DATA))
+        for index in range(2000):
+            assert context.resolve(f"${{a}}-{offset}-{index % 7}") == f"A-{offset}-{index % 7}"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        for future in [pool.submit(worker, offset) for offset in range(4)]:
+            future.result()
@@ -38,15 +38,29 @@ def _create_locator_repo(path: Path) -> None:
     workbook.save(path)
 
 
-def test_locator_resolution_primary(tmp_path: Path):
-    repo_path = tmp_path / "LocatorRepository.xlsx"
+@pytest.fixture(scope="session")
+def locator_repo(tmp_path_factory: pytest.TempPathFactory):
+    repo_path = tmp_path_factory.mktemp("locators") / "LocatorRepository.xlsx"
     _create_locator_repo(repo_path)
-    repo = load_locator_repository(str(repo_path))
-    resolver = LocatorResolver(repo)
+    return load_locator_repository(str(repo_path))
+
+
+_LOGIN_REPO = {
+    "LoginPage": {"submit": ("#loginBtn", "//button[text()='Login']", "button", "LoginPage")},
+}
+
+
+def test_locator_resolution_primary():
+    resolver = LocatorResolver(_LOGIN_REPO)
     selector = resolver.resolve("LoginPage.submit")
     assert selector == "css=#loginBtn"
 
 
+@pytest.mark.integration
+def test_locator_repository_from_excel(locator_repo):
+    assert locator_repo == _LOGIN_REPO
+
+
 def test_locator_missing_page():
     resolver = LocatorResolver({})
     with pytest.raises(ValueError, match="LocatorNotFoundException:"):
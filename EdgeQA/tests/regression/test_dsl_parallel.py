@@ -0,0 +1,158 @@
+"""Unit tests for the threaded DSL test case runner."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+from openpyxl import Workbook
+
+import core.engine.dsl_executor as dsl_executor
+from core.engine.dsl_executor import DslExecutor
+
+_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+_HEADER = ["Seq", "Execute", "COMMAND", "TARGET", "DATA"]
+
+
+class FakeLocator:
+    def count(self) -> int:
+        return 1
+
+
+class FakePage:
+    """Record fills; DATA is `<delay>` to sleep, `fail` to raise or `barrier` to wait for the other workers."""
+
+    barrier: Optional[threading.Barrier] = None
+
+    def fill(self, selector: str, value: str, timeout=None) -> None:
+        if value == "fail":
+            raise RuntimeError(f"fill failed on {selector}")
+        if value == "barrier":
+            self.barrier.wait(timeout=10)
+        elif value:
+            time.sleep(float(value))
+
+    def locator(self, _selector: str) -> FakeLocator:
+        return FakeLocator()
+
+
+class FakeManager:
+    def __init__(self, *_args, **_kwargs) -> None:
+        self.playwright = None
+
+    def start(self) -> FakePage:
+        return FakePage()
+
+    def stop(self) -> None:
+        pass
+
+    def screenshot_on_failure(self, name: str, full_page: bool = False) -> Optional[str]:
+        return None
+
+
+class FakeApiClient:
+    def __init__(self, **_kwargs) -> None:
+        pass
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+def _save_suite(path: Path, testcases: List[tuple]) -> str:
+    """Write one steps sheet per test case; each entry is (id, [(command, target, data), ...])."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "TestCases"
+    sheet.append(["TestCaseID", "Execute", "BeforeHook", "StepsSheet", "AfterHook"])
+    for tc_id, steps in testcases:
+        sheet.append([tc_id, "Y", None, f"{tc_id}_Steps", None])
+        steps_sheet = workbook.create_sheet(f"{tc_id}_Steps")
+        steps_sheet.append(_HEADER)
+        for seq, (command, target, data) in enumerate(steps, start=1):
+            steps_sheet.append([seq, "Y", command, target, data])
+    workbook.save(path)
+    return str(path)
+
+
+def _save_flow(flows_dir: Path, name: str, command: str, target: str, data: str) -> None:
+    workbook = Workbook()
+    workbook.active.append(_HEADER)
+    workbook.active.append([1, "Y", command, target, data])
+    workbook.save(flows_dir / f"{name}.flow.xlsx")
+
+
+@pytest.fixture
+def records(monkeypatch: pytest.MonkeyPatch) -> list:
+    captured: list = []
+    monkeypatch.setattr(dsl_executor, "PlaywrightManager", FakeManager)
+    monkeypatch.setattr(dsl_executor, "ApiClient", FakeApiClient)
+    monkeypatch.setattr(dsl_executor, "clean_screenshots", lambda _root: None)
+    monkeypatch.setattr(dsl_executor, "write_report", lambda _root, report: captured.extend(report))
+    return captured
+
+
+def _executor(tmp_path: Path, workers: int) -> DslExecutor:
+    return DslExecutor(_ROOT_DIR, flows_dir=str(tmp_path / "flows"), workers=workers)
+
+
+def test_results_keep_testcase_order(tmp_path: Path, records: list):
+    delays = ["0.3", "0.2", "0.1", "0", "0.05"]
+    suite = _save_suite(tmp_path / "TestCases.xlsx", [(f"TC{index}", [("TYPE", "#name", delay)]) for index, delay in enumerate(delays)])
+    _executor(tmp_path, workers=3).execute(suite)
+    assert [record.nodeid for record in records] == [f"TC{index}" for index in range(len(delays))]
+    assert {record.status for record in records} == {"PASSED"}
+
+
+def test_first_failing_testcase_error_is_raised(tmp_path: Path, records: list):
+    suite = _save_suite(
+        tmp_path / "TestCases.xlsx",
+        [
+            ("TC0", [("TYPE", "#ok", "")]),
+            ("TC1", [("TYPE", "#slow", "0.3"), ("TYPE", "#first", "fail")]),
+            ("TC2", [("TYPE", "#second", "fail")]),
+            ("TC3", [("TYPE", "#ok", "")]),
+        ],
+    )
+    with pytest.raises(RuntimeError, match="#first"):
+        _executor(tmp_path, workers=2).execute(suite)
+    assert [(record.nodeid, record.status) for record in records] == [
+        ("TC0", "PASSED"),
+        ("TC1", "FAILED"),
+        ("TC2", "FAILED"),
+        ("TC3", "PASSED"),
+    ]
+
+
+def test_missing_steps_sheet_fails_only_its_testcase(tmp_path: Path, records: list):
+    suite = str(tmp_path / "TestCases.xlsx")
+    workbook = Workbook()
+    workbook.active.title = "TestCases"
+    workbook.active.append(["TestCaseID", "Execute", "BeforeHook", "StepsSheet", "AfterHook"])
+    workbook.active.append(["TC0", "Y", None, "TC0_Steps", None])
+    workbook.active.append(["TC1", "Y", "Logn", "TC0_Steps", None])
+    workbook.create_sheet("TC0_Steps").append(_HEADER)
+    workbook.save(suite)
+    with pytest.raises(ValueError, match="Worksheet Logn does not exist."):
+        _executor(tmp_path, workers=2).execute(suite)
+    assert [(record.nodeid, record.status) for record in records] == [("TC0", "PASSED"), ("TC1", "FAILED")]
+
+
+def test_flow_depth_is_tracked_per_thread(tmp_path: Path, records: list, monkeypatch: pytest.MonkeyPatch):
+    workers = 3
+    flows_dir = tmp_path / "flows"
+    flows_dir.mkdir()
+    _save_flow(flows_dir, "outer", "CALL_FLOW", "middle", "")
+    _save_flow(flows_dir, "middle", "CALL_FLOW", "inner", "")
+    _save_flow(flows_dir, "inner", "TYPE", "#nested", "barrier")
+    # Every worker waits at the deepest flow, so a shared depth counter would overflow the limit of 3.
+    monkeypatch.setattr(FakePage, "barrier", threading.Barrier(workers))
+    suite = _save_suite(tmp_path / "TestCases.xlsx", [(f"TC{index}", [("CALL_FLOW", "outer", "")]) for index in range(workers)])
+    _executor(tmp_path, workers=workers).execute(suite)
+    assert [(record.nodeid, record.status) for record in records] == [(f"TC{index}", "PASSED") for index in range(workers)]
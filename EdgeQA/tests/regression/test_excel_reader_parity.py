@@ -0,0 +1,97 @@
+"""Parity tests for the calamine and openpyxl Excel backends."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook
+
+import data.excel_reader as excel_reader
+
+pytest.importorskip("python_calamine")
+
+
+def _create_suite(path: Path) -> None:
+    workbook = Workbook()
+    testcases = workbook.active
+    testcases.title = "TestCases"
+    testcases.append(["TestCaseID", "Description", "Execute"])
+    testcases.append(["TC_1", "Login", "Yes"])
+    testcases.append([None, None, None])
+    testcases.append(["TC_2", "Skipped", "N"])
+    testcases.append(["TC_3", 3.0, 1])
+
+    flows = workbook.create_sheet("FLOWS")
+    flows.append(["FlowName", "Step", "Action", "Locator", "Value", "Expected"])
+    flows.append(["Login", 2, "click", "LoginPage.submit", None, None])
+    flows.append(["Login", 1.0, "fill_text", "LoginPage.user", "007", ""])
+
+    # Header starts at C1: calamine must not drop the leading empty columns.
+    shifted = workbook.create_sheet("TC_1")
+    shifted["C1"], shifted["D1"], shifted["E1"], shifted["F1"], shifted["G1"] = "Step", "Action", "Locator", "Value", "Expected"
+    shifted.append([None, None, 1, "open_url", None, "/", None])
+    shifted.append([None, None, 2.0, "fill_text", "#amount", 2.5, 1e20])
+    shifted.append([None, None, 3, "fill_text", "#date", date(2024, 1, 3), datetime(2024, 1, 2, 10, 5)])
+    shifted.append([None, None, 4, "fill_text", "#time", time(10, 30), True])
+
+    # Header at B3: leading empty rows and columns together.
+    offset = workbook.create_sheet("TC_3")
+    offset["B3"], offset["C3"], offset["D3"] = "Step", "Action", "Value"
+    offset["B4"], offset["C4"], offset["D4"] = 1, "open_url", "/home"
+    offset["B6"], offset["C6"], offset["D6"] = 2, "assert_title", -4.0
+
+    workbook.active = workbook.sheetnames.index("TC_1")
+    workbook.save(path)
+
+
+def _trimmed(sheets):
+    trimmed = {}
+    for name, rows in sheets.items():
+        rows = [list(row) for row in rows]
+        for row in rows:
+            while row and row[-1] is None:
+                row.pop()
+        while rows and not rows[-1]:
+            rows.pop()
+        trimmed[name] = rows
+    return trimmed
+
+
+def _load(path: str):
+    excel_reader._read_workbook.cache_clear()
+    active_sheet, sheets = excel_reader.load_workbook_rows(path)
+    return (
+        active_sheet,
+        _trimmed(sheets),
+        excel_reader.load_all_from_excel(path),
+        excel_reader.load_steps_from_excel(path),
+        excel_reader.load_steps_from_excel(path, "TC_3"),
+    )
+
+
+@pytest.fixture(scope="session")
+def suite_path(tmp_path_factory: pytest.TempPathFactory) -> str:
+    path = tmp_path_factory.mktemp("parity") / "Suite.xlsx"
+    _create_suite(path)
+    return str(path)
+
+
+def test_calamine_matches_openpyxl(suite_path: str, monkeypatch: pytest.MonkeyPatch):
+    calamine = _load(suite_path)
+    monkeypatch.setattr(excel_reader, "CalamineWorkbook", None)
+    openpyxl = _load(suite_path)
+    excel_reader._read_workbook.cache_clear()
+    assert calamine == openpyxl
+
+
+def test_calamine_keeps_header_columns(suite_path: str):
+    excel_reader._read_workbook.cache_clear()
+    steps = excel_reader.load_steps_from_excel(suite_path, "TC_1")
+    assert [(step.step, step.action, step.value, step.expected) for step in steps] == [
+        ("1", "open_url", "/", None),
+        ("2", "fill_text", "2.5", "1e+20"),
+        ("3", "fill_text", "2024-01-03 00:00:00", "2024-01-02 10:05:00"),
+        ("4", "fill_text", "10:30:00", "True"),
+    ]
@@ -0,0 +1,35 @@
+"""Tests for the JSON step reader."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import data.json_reader as json_reader
+
+pytest.importorskip("ijson")
+
+_PAYLOAD = {
+    "steps": [
+        {"step": 1, "action": "open_url", "value": "/"},
+        {"step": "2", "action": " fill_text ", "locator": "#amount", "value": 1.50, "expected": 1e3},
+        {"step": 3.0, "action": "fill_text", "locator": "#qty", "value": 42, "expected": -0.25},
+        {"step": 4, "action": "assert_text", "locator": "#flag", "value": True, "expected": ""},
+    ]
+}
+
+
+def test_streamed_records_match_in_memory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    path = tmp_path / "steps.json"
+    # Raw text keeps number spellings like 1.50 and 1e3 that json.dumps would normalise.
+    text = json.dumps(_PAYLOAD).replace("1.5,", "1.50,").replace("1000.0", "1e3")
+    path.write_text(text, encoding="utf-8")
+
+    in_memory = json_reader.load_steps_from_json(str(path))
+    monkeypatch.setattr(json_reader, "_STREAM_THRESHOLD_BYTES", 0)
+    streamed = json_reader.load_steps_from_json(str(path))
+
+    assert streamed == in_memory
+    assert (in_memory[1].value, in_memory[1].expected) == ("1.5", "1000.0")
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+from typing import Callable, Union
 
-def assert_equal(actual: object, expected: object, message: str) -> None:
-    """Assert equality with a custom message."""
+Message = Union[str, Callable[[], str]]
+
+
+def assert_equal(actual: object, expected: object, message: Message) -> None:
+    """Assert equality with a custom message (or a callable building it)."""
     if actual != expected:
-        raise AssertionError(f"{message}. Expected={expected}, Actual={actual}")
+        raise AssertionError(f"{_render(message)}. Expected={expected}, Actual={actual}")
 
 
-def assert_true(condition: bool, message: str) -> None:
-    """Assert condition with a custom message."""
+def assert_true(condition: bool, message: Message) -> None:
+    """Assert condition with a custom message (or a callable building it)."""
     if not condition:
-        raise AssertionError(message)
+        raise AssertionError(_render(message))
+
+
+def _render(message: Message) -> str:
+    return message() if callable(message) else message
@@ -0,0 +1,26 @@
+"""Helpers shared by the threaded test runners."""
+
+from __future__ import annotations
+
+import asyncio
+import queue
+from typing import Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+def drain_queue(pending: "queue.SimpleQueue[T]") -> Iterator[T]:
+    """Yield queued items until the queue is empty."""
+    while True:
+        try:
+            yield pending.get_nowait()
+        except queue.Empty:
+            return
+
+
+def is_event_loop_running() -> bool:
+    """Return True if an asyncio loop is running in this thread."""
+    try:
+        return asyncio.get_running_loop().is_running()
+    except RuntimeError:
+        return False
@@ -2,32 +2,54 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from core.constants import DEFAULT_ENV, DEFAULT_BROWSER, ENV_VAR_ENV, ENV_VAR_BROWSER
 
+_CONFIG_FILES = ("config.yaml", "environments.yaml", "browsers.yaml")
+
 
 def _read_yaml(path: str) -> Dict[str, Any]:
     with open(path, "r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or {}
+        return yaml.load(handle, Loader=_YamlLoader) or {}
 
 
 def load_config(root_dir: str) -> Dict[str, Any]:
-    """Load framework configuration from YAML files."""
-    config_path = os.path.join(root_dir, "config", "config.yaml")
-    envs_path = os.path.join(root_dir, "config", "environments.yaml")
-    browsers_path = os.path.join(root_dir, "config", "browsers.yaml")
+    """Load framework configuration from YAML files, reusing it until a file changes."""
+    config_dir = os.path.join(os.path.abspath(root_dir), "config")
+    paths = tuple(os.path.join(config_dir, name) for name in _CONFIG_FILES)
+    # Hand out a copy: callers edit their config, and the cached dict is shared.
+    cached = _load_config_cached(
+        paths,
+        tuple(_mtime_ns(path) for path in paths),
+        os.getenv(ENV_VAR_ENV, DEFAULT_ENV),
+        os.getenv(ENV_VAR_BROWSER, DEFAULT_BROWSER),
+    )
+    return copy.deepcopy(cached)
+
 
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(
+    paths: Tuple[str, str, str],
+    mtimes: Tuple[int, int, int],
+    env_name: str,
+    browser_name: str,
+) -> Dict[str, Any]:
+    config_path, envs_path, browsers_path = paths
     config = _read_yaml(config_path)
     envs = _read_yaml(envs_path)
     browsers = _read_yaml(browsers_path)
 
-    env_name = os.getenv(ENV_VAR_ENV, DEFAULT_ENV)
-    browser_name = os.getenv(ENV_VAR_BROWSER, DEFAULT_BROWSER)
-
     selected_env = envs.get(env_name, {})
     selected_browser = browsers.get(browser_name, {})
 
@@ -40,3 +62,10 @@ def load_config(root_dir: str) -> Dict[str, Any]:
         "all_environments": envs,
         "all_browsers": browsers,
     }
+
+
+def _mtime_ns(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
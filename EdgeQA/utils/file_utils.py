@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import shutil
 from typing import Iterable
 
 
@@ -21,3 +22,15 @@ def ensure_dirs(paths: Iterable[str]) -> None:
 def resolve_path(root_dir: str, *parts: str) -> str:
     """Resolve a path relative to the framework root."""
     return os.path.join(root_dir, *parts)
+
+
+def link_or_copy(source: str, dest: str) -> None:
+    """Hard-link source to dest, copying when linking is not possible."""
+    try:
+        os.unlink(dest)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(source, dest)
+    except OSError:
+        shutil.copyfile(source, dest)
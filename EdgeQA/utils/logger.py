@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+
+_LISTENERS: List[QueueListener] = []
+_PROC_TIMESTAMP = datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
 def _ensure_dir(path: str) -> None:
@@ -13,6 +19,14 @@ def _ensure_dir(path: str) -> None:
         os.makedirs(path, exist_ok=True)
 
 
+def _stop_listeners() -> None:
+    while _LISTENERS:
+        _LISTENERS.pop().stop()
+
+
+atexit.register(_stop_listeners)
+
+
 def get_logger(name: str, logs_dir: str = "logs", level: int = logging.INFO) -> logging.Logger:
     """Create or return a configured logger with file and console handlers."""
     logger = logging.getLogger(name)
@@ -22,23 +36,30 @@ def get_logger(name: str, logs_dir: str = "logs", level: int = logging.INFO) ->
     _ensure_dir(logs_dir)
     logger.setLevel(level)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_path = os.path.join(logs_dir, f"{name}_{timestamp}.log")
+    log_path = os.path.join(logs_dir, f"{name}_{_PROC_TIMESTAMP}_{os.getpid()}.log")
 
     formatter = logging.Formatter(
         fmt="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
-    file_handler = logging.FileHandler(log_path, encoding="utf-8")
+    # File writes happen on a listener thread; the console handler stays inline so
+    # pytest still attributes stderr output to the test that produced it.
+    file_handler = logging.FileHandler(log_path, encoding="utf-8", delay=True)
     file_handler.setFormatter(formatter)
     file_handler.setLevel(level)
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    _LISTENERS.append(listener)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setLevel(level)
 
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
     console_handler.setLevel(level)
 
-    logger.addHandler(file_handler)
+    logger.addHandler(queue_handler)
     logger.addHandler(console_handler)
     logger.propagate = False
 